@@ -35,15 +35,20 @@ def run() -> int:
 
     window: MainWindow = MainWindow()
     # if a command line argument starts with `-check`, enable the auto-reload timer
-    index: int
     argv: str
-    check_file_updates: bool = "-check" in sys.argv[1:] or "--check" in sys.argv[1:]
-    for index, argv in enumerate(sys.argv[1:], start=1):
-        if argv.split()[0] == "-check":
+    file_names: list[str] = []
+    check_file_updates: bool = False
+    for argv in sys.argv[1:]:
+        if argv in ("-check", "--check"):
             check_file_updates = True
-            sys.argv[index] = argv[len("-check") :].lstrip()
+        elif argv.startswith("-check") and argv[len("-check") : len("-check") + 1].isspace():
+            check_file_updates = True
+            file_names.append(argv[len("-check") :].lstrip())
+        elif argv:
+            file_names.append(argv)
     window.load_file(
-        (QtCore.QUrl(argv).path() or argv for argv in sys.argv[1:]),
+        # parse only what looks like a URL; besides, `QUrl` takes a Windows drive letter for a scheme
+        ((QtCore.QUrl(argv).path() or argv) if "://" in argv else argv for argv in file_names),
         check_file_updates=check_file_updates,
     )
     window.show()
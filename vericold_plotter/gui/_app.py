@@ -13,12 +13,10 @@ app: QtWidgets.QApplication = QtWidgets.QApplication.instance() or QtWidgets.QAp
 if parse(QtCore.qVersion()) < parse("6"):
     QtWidgets.QApplication.setAttribute(QtCore.Qt.ApplicationAttribute.AA_UseHighDpiPixmaps)
 
+translations_path: str = QtCore.QLibraryInfo.path(QtCore.QLibraryInfo.LibraryPath.TranslationsPath)
+
 qtbase_translator: QtCore.QTranslator = QtCore.QTranslator()
-if qtbase_translator.load(
-    QtCore.QLocale(),
-        "qtbase", "_",
-        QtCore.QLibraryInfo.location(QtCore.QLibraryInfo.LibraryPath.TranslationsPath),
-):
+if qtbase_translator.load(QtCore.QLocale(), "qtbase", "_", translations_path):
     QtWidgets.QApplication.installTranslator(qtbase_translator)
 
 self_color_scheme: QtCore.Qt.ColorScheme = QtWidgets.QApplication.styleHints().colorScheme()
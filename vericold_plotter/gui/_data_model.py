@@ -6,18 +6,49 @@ from typing import Iterable, Sequence
 import numpy as np
 from numpy.typing import NDArray
 
-__all__ = ["DataModel"]
+__all__ = ["DataModel", "clean_data"]
+
+
+def clean_data(data: NDArray[np.float64], header: Sequence[str]) -> tuple[NDArray[np.float64], list[str]]:
+    # drop the line numbers and mark the impossible temperatures as unknown;
+    # a read-only array is copied only if it's to be altered, and the data already clean is returned as is
+    good: NDArray[np.bool_] = np.full(data.shape[0], True, dtype=np.bool_)
+    if "LineNumber" in header:
+        good[header.index("LineNumber")] = False
+    if not np.all(good):
+        data = data[good]  # makes a copy anyway
+    new_header: list[str] = [str(s) for s, g in zip(header, good) if g]
+    # one mask buffer is reused for every temperature column instead of a mask of the whole table
+    not_positive: NDArray[np.bool_] = np.empty(data.shape[1:], dtype=np.bool_)
+    i: int
+    c: str
+    for i, c in enumerate(new_header):
+        if c.endswith("(K)"):  # temperature values must be positive
+            np.less_equal(data[i], 0.0, out=not_positive)
+            if not not_positive.any():
+                continue
+            if not data.flags.writeable:
+                data = data.copy()
+            data[i, not_positive] = np.nan
+    return data, new_header
 
 
 class DataModel:
     def __init__(self) -> None:
         self._data: NDArray[np.float64] = np.empty((0, 0), dtype=np.float64)
         self._header: list[str] = []
+        self._header_index: dict[str, int] = {}
 
     @property
     def header(self) -> list[str]:
         return self._header
 
+    def column_index(self, column_name: str) -> int:
+        try:
+            return self._header_index[column_name]
+        except KeyError:
+            raise ValueError(f"{column_name!r} is not in the header") from None
+
     @property
     def row_count(self) -> int:
         return self._data.shape[1]
@@ -41,15 +72,11 @@ class DataModel:
         new_data: Iterable[Iterable[float]] | NDArray[np.float64],
         new_header: Sequence[str] | None = None,
     ) -> None:
-        self._data = np.array(new_data)
-        good: NDArray[np.bool_] = np.full(self._data.shape[0], True, dtype=np.bool_)
-        if new_header is not None and "LineNumber" in new_header:
-            good[new_header.index("LineNumber")] = False
-        self._data = self._data[good]
+        self._data = np.asarray(new_data, dtype=np.float64)
         if new_header is not None:
-            self._header = [str(s) for s, g in zip(new_header, good) if g]
+            self._data, self._header = clean_data(self._data, new_header)
+            self._header_index = {}
             i: int
             c: str
             for i, c in enumerate(self._header):
-                if c.endswith("(K)"):  # temperature values must be positive
-                    self._data[self._data <= 0.0] = np.nan
+                self._header_index.setdefault(c, i)  # like `list.index`, point to the first occurrence
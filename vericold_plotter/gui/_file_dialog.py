@@ -2,24 +2,142 @@
 from __future__ import annotations
 
 import importlib.util
+import math
 import mimetypes
-from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Callable, Collection, Iterable, NamedTuple, TextIO, cast, final
+from typing import Callable, ClassVar, Collection, Final, Iterable, NamedTuple, TextIO, cast, final
 
 import numpy as np
 from numpy.typing import NDArray
-from pyqtgraph.Qt import QtWidgets
+from pyqtgraph.Qt import QtCore, QtWidgets
 
 from ._settings import Settings
 
-__all__ = ["FileDialog"]
+__all__ = ["FileDialog", "FileWriterSignals"]
+
+_CSV_BUFFER_SIZE: Final[int] = 1 << 20
+_CSV_CHUNK_SIZE: Final[int] = 1 << 12
+
+
+def _utc_offset(timestamp: float) -> float:
+    try:
+        return cast(timedelta, datetime.fromtimestamp(timestamp).astimezone().utcoffset()).total_seconds()
+    except (ValueError, OverflowError, OSError):  # `NaN`, overflow, or `localtime()` failure
+        return math.nan
+
+
+def _excel_local_time(timestamps: NDArray[np.float64]) -> list[float | None]:
+    # Excel stores the local time as the days since 1899-12-30, and the date format of the cell shows it;
+    # the modern UTC offsets are whole quarters of an hour, and they change at a whole local hour or half an hour,
+    # i.e., at a whole quarter of a UTC hour, so the offset is found once per 15 minutes, not for every value
+    quarters: NDArray[np.float64] = np.floor(timestamps / 900.0)
+    finite: NDArray[np.bool_] = np.isfinite(quarters)
+    unique_quarters: NDArray[np.float64]
+    quarter_indices: NDArray[np.intp]
+    unique_quarters, quarter_indices = np.unique(quarters[finite], return_inverse=True)
+    offsets: NDArray[np.float64] = np.array(
+        [_utc_offset(q * 900.0) for q in unique_quarters.tolist()],
+        dtype=np.float64,
+    )
+    days: NDArray[np.float64] = np.full(timestamps.shape, np.nan)
+    days[finite] = (timestamps[finite] + offsets[quarter_indices.ravel()]) / 86400.0 + 25569.0
+    # leave the cells empty where the time is unknown
+    return [(d if math.isfinite(d) else None) for d in days.tolist()]
+
+
+def _write_csv(filename: str, data: NDArray[np.float64], header: list[str], separator: str, line_end: str) -> None:
+    if data.ndim != 2:
+        raise ValueError(f"Invalid data shape: {data.shape}")
+
+    f_out: TextIO
+    with open(filename, "wt", newline=line_end, buffering=_CSV_BUFFER_SIZE) as f_out:
+        f_out.write(separator.join(header) + "\n")
+        # Python floats are written the same way as NumPy ones but much faster;
+        # converting the rows in chunks keeps the memory used by the Python objects bounded
+        start: int
+        for start in range(0, data.shape[1], _CSV_CHUNK_SIZE):
+            f_out.writelines(
+                separator.join(map(str, row)) + "\n" for row in data[:, start : start + _CSV_CHUNK_SIZE].T.tolist()
+            )
+
+
+def _write_xlsx(filename: str, data: NDArray[np.float64], header: list[str], sheet_name: str) -> None:
+    from pyexcelerate import Font, Format, Panes, Style, Workbook, Worksheet
+
+    if data.ndim != 2:
+        raise ValueError(f"Invalid data shape: {data.shape}")
+
+    is_time: list[bool] = [title.endswith(("(s)", "(secs)")) for title in header]
+
+    # filling the sheet cell by cell is slow, while a list of rows is taken as is
+    columns: list[list[float] | list[float | None]] = [
+        (_excel_local_time(column) if column_is_time else column.tolist())
+        for column_is_time, column in zip(is_time, data)
+    ]
+    rows: list[list[str] | list[float | None]] = [header]
+    rows.extend(map(list, zip(*columns)))
+
+    workbook: Workbook = Workbook()
+    worksheet: Worksheet = workbook.new_sheet(sheet_name, data=rows)
+    worksheet.panes = Panes(y=1)  # freeze first row
+
+    header_style: Style = Style(font=Font(bold=True))
+    # the numbers are shorter than the dates shown, so the auto size would be too narrow
+    datetime_style: Style = Style(format=Format("yyyy-mm-dd hh:mm:ss"), size=20)
+    auto_size_style: Style = Style(size=-1)
+
+    # the cells take the style of the column unless the row has its own
+    col: int
+    column_is_time: bool
+    for col, column_is_time in enumerate(is_time, start=1):
+        worksheet.set_col_style(col, datetime_style if column_is_time else auto_size_style)
+    worksheet.set_row_style(1, header_style)
+    workbook.save(filename)
+
+
+class FileWriterSignals(QtCore.QObject):
+    """The signals of the file writing, for a `QRunnable` is not a `QObject`"""
+
+    # the name of the file to be written
+    started: ClassVar[QtCore.Signal] = QtCore.Signal(str, name="started")
+    # the name of the file written
+    written: ClassVar[QtCore.Signal] = QtCore.Signal(str, name="written")
+    # the name of the file and the error message
+    failed: ClassVar[QtCore.Signal] = QtCore.Signal(str, str, name="failed")
+
+
+class _FileWriter(QtCore.QRunnable):
+    """Write a file in a pool thread for the UI to stay responsive"""
+
+    def __init__(self, filename: str, write: Callable[[], None], signals: FileWriterSignals) -> None:
+        super().__init__()
+
+        self.filename: str = filename
+        self.write: Callable[[], None] = write
+        # the signals object lives in the thread of the receiver, so the slots are called there
+        self.signals: FileWriterSignals = signals
+
+    def run(self) -> None:
+        try:
+            self.write()
+        except Exception as ex:
+            self.signals.failed.emit(self.filename, str(ex) or repr(ex))
+        else:
+            self.signals.written.emit(self.filename)
+
+
+@lru_cache(maxsize=1)
+def _xlsx_supported() -> bool:
+    # the answer holds, for the package is hardly installed or removed while the application runs
+    return importlib.util.find_spec("pyexcelerate") is not None
 
 
 class MimeType(NamedTuple):
     mimetypes: Collection[str]
-    saver: Callable[[str, NDArray[np.float64], Iterable[str]], None]
+    # the saver reads the settings and returns the function that writes the file in a pool thread
+    saver: Callable[[str, NDArray[np.float64], Iterable[str]], Callable[[], None]]
 
 
 @final
@@ -55,53 +173,18 @@ class FileDialog(QtWidgets.QFileDialog):
         format_lines.append(self.tr("All files", "file type") + "(* *.*)")
         return format_lines
 
-    def _save_csv(self, filename: str, data: NDArray[np.float64], header: Iterable[str]) -> None:
-        if data.ndim != 2:
-            raise ValueError(f"Invalid data shape: {data.shape}")
-
-        f_out: TextIO
-        with open(filename, "wt", newline=self.settings.line_end) as f_out:
-            f_out.write(self.settings.csv_separator.join(header) + "\n")
-            f_out.writelines(
-                (
-                    (self.settings.csv_separator.join(f"{xii}" for xii in xi) if isinstance(xi, Iterable) else f"{xi}")
-                    + "\n"
-                )
-                for xi in data.T
-            )
-
-    def _save_xlsx(self, filename: str, data: NDArray[np.float64], header: Iterable[str]) -> None:
-        from pyexcelerate import Font, Format, Panes, Style, Workbook, Worksheet
-
-        if data.ndim != 2:
-            raise ValueError(f"Invalid data shape: {data.shape}")
-
-        header = list(header)
+    def _save_csv(self, filename: str, data: NDArray[np.float64], header: Iterable[str]) -> Callable[[], None]:
+        return partial(
+            _write_csv,
+            filename,
+            data,
+            list(header),
+            separator=self.settings.csv_separator,
+            line_end=self.settings.line_end,
+        )
 
-        workbook: Workbook = Workbook()
-        worksheet: Worksheet = workbook.new_sheet(Path(self.settings.opened_file_name).stem)
-        worksheet.panes = Panes(y=1)  # freeze first row
-
-        header_style: Style = Style(font=Font(bold=True))
-        datetime_style: Style = Style(format=Format("yyyy-mm-dd hh:mm:ss"), size=-1)
-        auto_size_style: Style = Style(size=-1)
-
-        col: int
-        row: int
-        for col in range(data.shape[0]):
-            worksheet.set_cell_value(1, col + 1, header[col])
-            if header[col].endswith(("(s)", "(secs)")):
-                for row in range(data.shape[1]):
-                    # `NaN`, overflow, or `localtime()` or `gmtime()` failure
-                    with suppress(ValueError, OverflowError, OSError):
-                        worksheet.set_cell_value(row + 2, col + 1, datetime.fromtimestamp(cast(float, data[col, row])))
-                    worksheet.set_cell_style(row + 2, col + 1, datetime_style)
-            else:
-                for row in range(data.shape[1]):
-                    worksheet.set_cell_value(row + 2, col + 1, data[col, row])
-                    worksheet.set_cell_style(row + 2, col + 1, auto_size_style)
-        worksheet.set_row_style(1, header_style)
-        workbook.save(filename)
+    def _save_xlsx(self, filename: str, data: NDArray[np.float64], header: Iterable[str]) -> Callable[[], None]:
+        return partial(_write_xlsx, filename, data, list(header), Path(self.settings.opened_file_name).stem)
 
     def get_open_filenames(self) -> list[str]:
         opened_filename: str = self.settings.opened_file_name
@@ -125,8 +208,10 @@ class FileDialog(QtWidgets.QFileDialog):
             return self.selectedFiles()
         return []
 
-    def export(self, data: NDArray[np.float64], header: Iterable[str]) -> None:
-        mimetypes.init()
+    def export(self, data: NDArray[np.float64], header: Iterable[str], signals: FileWriterSignals) -> None:
+        # the file is written in a pool thread, and the signals tell when it's over
+        if not mimetypes.inited:  # otherwise, `init` reads the system MIME type files again
+            mimetypes.init()
 
         exported_filename: str = self.settings.exported_file_name
         opened_filename: str = self.settings.opened_file_name
@@ -134,7 +219,7 @@ class FileDialog(QtWidgets.QFileDialog):
         supported_formats: list[MimeType] = [
             MimeType((mimetypes.types_map[".csv"],), self._save_csv),
         ]
-        if importlib.util.find_spec("pyexcelerate") is not None:
+        if _xlsx_supported():
             supported_formats.append(MimeType((mimetypes.types_map[".xlsx"],), self._save_xlsx))
         selected_format: MimeType | None = None
         if exported_filename:
@@ -203,8 +288,14 @@ class FileDialog(QtWidgets.QFileDialog):
 
             for supported_format in supported_formats:
                 if new_file_mimetype in supported_format.mimetypes:
-                    supported_format.saver(new_file_name, data, header)
+                    writer: _FileWriter = _FileWriter(
+                        new_file_name,
+                        supported_format.saver(new_file_name, data, header),
+                        signals,
+                    )
                     self.settings.exported_file_name = new_file_name
+                    signals.started.emit(new_file_name)
+                    QtCore.QThreadPool.globalInstance().start(writer)
                     break
 
             # we should never reach to here
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+from typing import ClassVar, NamedTuple, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+from pyqtgraph.Qt import QtCore
+
+from ..log_parser import parse
+from ._data_model import clean_data
+
+__all__ = ["FileParser", "FileParserSignals", "ParsedFile"]
+
+
+class ParsedFile(NamedTuple):
+    """The file parsed, for reloading it to take only what has been changed"""
+
+    file_name: str
+    modified: int
+    size: int
+    # the titles and the data as the data model keeps them, so that the model and the parser share the array
+    titles: list[str]
+    data: NDArray[np.float64]
+
+
+def _parse_appended(file_name: str, last_parsed: ParsedFile) -> tuple[list[str], NDArray[np.float64]] | None:
+    # a log grows record by record, so parse only the new records and the last known one to check it's still there
+    if last_parsed.data.ndim != 2 or not last_parsed.data.shape[1]:
+        return None  # nothing to append to, e.g., the log had no records yet
+    records_count: int = last_parsed.data.shape[1]
+    titles: list[str]
+    data: NDArray[np.float64]
+    titles, data = parse(file_name, skip_records=records_count - 1)
+    if data.ndim != 2 or not data.shape[1]:
+        return None  # the file has been rewritten
+    data, titles = clean_data(data, titles)
+    if titles != last_parsed.titles or not np.array_equal(data[:, 0], last_parsed.data[:, -1], equal_nan=True):
+        return None  # the file has been rewritten
+    return titles, np.concatenate((last_parsed.data, data[:, 1:]), axis=1)
+
+
+def _parse(file_name: str, last_parsed: ParsedFile | None) -> ParsedFile:
+    stat: os.stat_result = os.stat(file_name)
+    if last_parsed is not None and last_parsed.file_name == file_name:
+        if last_parsed.modified == stat.st_mtime_ns and last_parsed.size == stat.st_size:
+            return last_parsed  # reloading a file that is not changed is free
+
+    titles: list[str]
+    data: NDArray[np.float64]
+    appended: tuple[list[str], NDArray[np.float64]] | None = None
+    if last_parsed is not None and last_parsed.file_name == file_name and last_parsed.size < stat.st_size:
+        appended = _parse_appended(file_name, last_parsed)
+    if appended is not None:
+        titles, data = appended
+    else:
+        titles, data = parse(file_name)
+        # clean the data here, so that `DataModel.set_data` has nothing to alter and takes the array as is
+        data, titles = clean_data(data, titles)
+    data.setflags(write=False)  # the data is shared by the data model and the next reload
+    return ParsedFile(file_name, stat.st_mtime_ns, stat.st_size, titles, data)
+
+
+class FileParserSignals(QtCore.QObject):
+    """The signals of `FileParser`, for a `QRunnable` is not a `QObject`"""
+
+    # the number of the request, the name of the file parsed last, the titles, the data,
+    # and the `ParsedFile` to pass to the next reload, or `None` if several files have been parsed
+    parsed: ClassVar[QtCore.Signal] = QtCore.Signal(int, str, list, object, object, name="parsed")
+    # the number of the request and the error message
+    failed: ClassVar[QtCore.Signal] = QtCore.Signal(int, str, name="failed")
+    # the number of the request, when the parsing is over, whether it has succeeded or not
+    finished: ClassVar[QtCore.Signal] = QtCore.Signal(int, name="finished")
+
+
+class FileParser(QtCore.QRunnable):
+    """Parse the files in a pool thread for the UI to stay responsive"""
+
+    def __init__(
+        self,
+        request: int,
+        file_names: Sequence[str],
+        last_parsed: ParsedFile | None,
+        signals: FileParserSignals,
+    ) -> None:
+        super().__init__()
+
+        self.request: int = request
+        self.file_names: Sequence[str] = file_names
+        # the state of the previous parsing is owned by the UI thread, and it's never altered, only replaced
+        self.last_parsed: ParsedFile | None = last_parsed
+        # the signals object lives in the thread of the receiver, so the slots are called there
+        self.signals: FileParserSignals = signals
+
+    def run(self) -> None:
+        try:
+            self._parse_files()
+        finally:
+            self.signals.finished.emit(self.request)
+
+    def _parse_files(self) -> None:
+        parsed_file: ParsedFile
+        all_parsed: list[ParsedFile] = []
+        _file_name: str
+        for _file_name in self.file_names:
+            try:
+                parsed_file = _parse(_file_name, self.last_parsed)
+            except (IOError, RuntimeError, ValueError, IndexError) as ex:
+                self.signals.failed.emit(self.request, " ".join(repr(a) for a in ex.args))
+            else:
+                all_parsed.append(parsed_file)
+        if not all_parsed:
+            return
+        if len(all_parsed) == 1:
+            parsed_file = all_parsed[0]
+            self.signals.parsed.emit(
+                self.request,
+                parsed_file.file_name,
+                parsed_file.titles,
+                parsed_file.data,
+                parsed_file,
+            )
+            return
+        # use only the files with identical columns
+        titles: list[str] = all_parsed[-1].titles
+        i: int = len(all_parsed) - 2
+        while i >= 0 and all_parsed[i].titles == titles:
+            i -= 1
+        data: NDArray[np.float64]
+        try:
+            data = np.column_stack([p.data for p in all_parsed[i + 1 :]])
+        except ValueError as ex:  # e.g., an empty file among the others
+            self.signals.failed.emit(self.request, " ".join(repr(a) for a in ex.args))
+            return
+        self.signals.parsed.emit(self.request, all_parsed[-1].file_name, titles, data, None)
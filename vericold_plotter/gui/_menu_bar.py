@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+from typing import Callable
+
 from pyqtgraph.Qt import QtGui, QtWidgets
 
 __all__ = ["MenuBar"]
 
+_theme_icons: dict[str, QtGui.QIcon] = {}
+
+
+def _theme_icon(name: str, fallback: Callable[[], QtGui.QIcon] | None = None) -> QtGui.QIcon:
+    # the theme is searched once per icon name, and the fallback icon is made only when the theme lacks the icon
+    if name not in _theme_icons:
+        if fallback is None or QtGui.QIcon.hasThemeIcon(name):
+            _theme_icons[name] = QtGui.QIcon.fromTheme(name)
+        else:
+            _theme_icons[name] = fallback()
+    return _theme_icons[name]
+
 
 class MenuBar(QtWidgets.QMenuBar):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
@@ -29,21 +43,23 @@ class MenuBar(QtWidgets.QMenuBar):
         self.menu_file.setObjectName("menu_file")
         self.menu_about.setObjectName("menu_about")
 
+        style: QtWidgets.QStyle = self.style()
+
         self.action_open.setIcon(
-            QtGui.QIcon.fromTheme(
+            _theme_icon(
                 "document-open",
-                self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_DialogOpenButton),
+                lambda: style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_DialogOpenButton),
             )
         )
         self.action_open.setObjectName("action_open")
-        self.action_export.setIcon(QtGui.QIcon.fromTheme("document-save-as"))
+        self.action_export.setIcon(_theme_icon("document-save-as"))
         self.action_export.setObjectName("action_export")
-        self.action_export_visible.setIcon(QtGui.QIcon.fromTheme("document-save-as"))
+        self.action_export_visible.setIcon(_theme_icon("document-save-as"))
         self.action_export_visible.setObjectName("action_export_visible")
         self.action_reload.setIcon(
-            QtGui.QIcon.fromTheme(
+            _theme_icon(
                 "view-refresh",
-                self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_BrowserReload),
+                lambda: style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_BrowserReload),
             )
         )
         self.action_reload.setObjectName("action_reload")
@@ -51,25 +67,25 @@ class MenuBar(QtWidgets.QMenuBar):
         self.action_preferences.setMenuRole(QtGui.QAction.MenuRole.PreferencesRole)
         self.action_preferences.setObjectName("action_preferences")
         self.action_quit.setIcon(
-            QtGui.QIcon.fromTheme(
+            _theme_icon(
                 "application-exit",
-                self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_DialogCloseButton),
+                lambda: style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_DialogCloseButton),
             )
         )
         self.action_quit.setMenuRole(QtGui.QAction.MenuRole.QuitRole)
         self.action_quit.setObjectName("action_quit")
         self.action_about.setIcon(
-            QtGui.QIcon.fromTheme(
+            _theme_icon(
                 "help-about",
-                self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_DialogHelpButton),
+                lambda: style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_DialogHelpButton),
             )
         )
         self.action_about.setMenuRole(QtGui.QAction.MenuRole.AboutRole)
         self.action_about.setObjectName("action_about")
         self.action_about_qt.setIcon(
-            QtGui.QIcon.fromTheme(
+            _theme_icon(
                 "help-about-qt",
-                QtGui.QIcon(":/qt-project.org/q" "messagebox/images/qt" "logo-64.png"),
+                lambda: QtGui.QIcon(":/qt-project.org/q" "messagebox/images/qt" "logo-64.png"),
             )
         )
         self.action_about_qt.setMenuRole(QtGui.QAction.MenuRole.AboutQtRole)
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from itertools import cycle
-from typing import Any, Iterable, TypeVar, cast
+from math import floor
+from typing import Any, ClassVar, Final, Iterable, NamedTuple, TypeVar, cast
 
 import numpy as np
 from numpy.typing import NDArray
@@ -15,10 +17,9 @@ from pyqtgraph import (
     PlotItem,
     PlotWidget,
     SignalProxy,
-    TextItem,
     ViewBox,
 )
-from pyqtgraph.functions import mkBrush, mkPen
+from pyqtgraph.functions import mkBrush, mkColor, mkPen
 from pyqtgraph.GraphicsScene.mouseEvents import MouseClickEvent  # type: ignore
 from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 
@@ -29,6 +30,9 @@ __all__ = ["Plot"]
 
 _T = TypeVar("_T")
 _THE_BEGINNING_OF_TIME: datetime = datetime.fromtimestamp(0)
+_CACHE_FRIENDLY_CHUNK_SIZE: Final[int] = 1 << 14  # 128 KiB of `float64`
+_BLOCK_SIZE: Final[int] = 1 << 10
+_CURSOR_RATE_LIMIT: Final[float] = 30.0  # Hz
 
 
 def normalize(a: NDArray[_T]) -> NDArray[_T]:
@@ -37,7 +41,206 @@ def normalize(a: NDArray[_T]) -> NDArray[_T]:
     return (a - min_a) / (max_a - min_a)
 
 
+@lru_cache(maxsize=1)
+def whole_seconds_to_text(seconds: int) -> str:
+    # don't use `datetime.fromtimestamp` here directly to avoid OSError on Windows when x < 0;
+    # shifting the local time of the epoch also spares the time zone lookup on every mouse move
+    return str(_THE_BEGINNING_OF_TIME + timedelta(seconds=seconds))
+
+
+def timestamp_to_text(timestamp: float) -> str:
+    # the cursor stays within the same second for many mouse moves, so only the fraction is formatted anew
+    seconds: int = floor(timestamp)
+    microseconds: int = round((timestamp - seconds) * 1e6)
+    if microseconds >= 1_000_000:
+        seconds += 1
+        microseconds -= 1_000_000
+    if not microseconds:
+        return whole_seconds_to_text(seconds)
+    return f"{whole_seconds_to_text(seconds)}.{microseconds:06d}"
+
+
+def is_sorted(a: NDArray[np.float64] | None) -> bool:
+    return a is not None and bool(np.all(a[1:] >= a[:-1]))
+
+
+def same_data(old: NDArray[np.float64] | None, new: NDArray[np.float64]) -> bool:
+    return old is not None and old.shape == new.shape and np.array_equal(old, new, equal_nan=True)
+
+
+def nan_min_max(a: NDArray[np.float64]) -> tuple[float, float]:
+    # `fmin` and `fmax` skip NaNs without warnings and without temporary arrays;
+    # each chunk is read from the memory once, and then it's taken from the CPU cache for the second reduction
+    min_a: float = np.nan
+    max_a: float = np.nan
+    start: int
+    for start in range(0, a.size, _CACHE_FRIENDLY_CHUNK_SIZE):
+        chunk: NDArray[np.float64] = a[start : start + _CACHE_FRIENDLY_CHUNK_SIZE]
+        min_a = np.fmin(min_a, np.fmin.reduce(chunk))
+        max_a = np.fmax(max_a, np.fmax.reduce(chunk))
+    return float(min_a), float(max_a)
+
+
+def block_min_max(a: NDArray[np.float64]) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    # the NaN-skipping minimum and maximum of every full block of `a`; the last incomplete block is left out
+    blocks: NDArray[np.float64] = a[: a.size // _BLOCK_SIZE * _BLOCK_SIZE].reshape((-1, _BLOCK_SIZE))
+    min_a: NDArray[np.float64] = np.empty(blocks.shape[0], dtype=np.float64)
+    max_a: NDArray[np.float64] = np.empty(blocks.shape[0], dtype=np.float64)
+    blocks_per_chunk: int = max(1, _CACHE_FRIENDLY_CHUNK_SIZE // _BLOCK_SIZE)
+    start: int
+    for start in range(0, blocks.shape[0], blocks_per_chunk):
+        chunk: slice = slice(start, start + blocks_per_chunk)
+        np.fmin.reduce(blocks[chunk], axis=1, out=min_a[chunk])
+        np.fmax.reduce(blocks[chunk], axis=1, out=max_a[chunk])
+    return min_a, max_a
+
+
+class LineStats(NamedTuple):
+    """The bounds of a line data computed once when the data is set"""
+
+    x_sorted: bool = True
+    x_min: float = np.nan
+    x_max: float = np.nan
+    y_min: float = np.nan
+    y_max: float = np.nan
+    y_min_positive: float = np.nan
+    # the bounds of every `_BLOCK_SIZE` points to find the bounds of a part of the line quickly
+    y_block_min: NDArray[np.float64] = np.empty(0)
+    y_block_max: NDArray[np.float64] = np.empty(0)
+    y_block_min_positive: NDArray[np.float64] = np.empty(0)
+
+
+def line_stats(x: NDArray[np.float64] | None, y: NDArray[np.float64] | None) -> LineStats:
+    if x is None or y is None or not x.size or not y.size:
+        return LineStats()
+    x_sorted: bool = is_sorted(x)
+    y_block_min: NDArray[np.float64]
+    y_block_max: NDArray[np.float64]
+    y_block_min, y_block_max = block_min_max(y)
+    y_tail: NDArray[np.float64] = y[y_block_min.size * _BLOCK_SIZE :]
+    y_min: float = float(np.fmin(nan_min_max(y_block_min)[0], nan_min_max(y_tail)[0]))
+    y_max: float = float(np.fmax(nan_min_max(y_block_max)[1], nan_min_max(y_tail)[1]))
+    y_min_positive: float = y_min
+    y_block_min_positive: NDArray[np.float64] = y_block_min
+    if not y_min > 0.0:
+        if y_max > 0.0:
+            positive_y: NDArray[np.float64] = np.where(y > 0.0, y, np.nan)
+            y_block_min_positive = block_min_max(positive_y)[0]
+            positive_y_tail: NDArray[np.float64] = positive_y[y_block_min.size * _BLOCK_SIZE :]
+            y_min_positive = float(np.fmin(nan_min_max(y_block_min_positive)[0], nan_min_max(positive_y_tail)[0]))
+        else:
+            y_block_min_positive = np.full_like(y_block_min, np.nan)
+            y_min_positive = np.nan
+    return LineStats(
+        x_sorted=x_sorted,
+        x_min=float(x[0] if x_sorted else np.fmin.reduce(x)),
+        x_max=float(x[-1] if x_sorted else np.fmax.reduce(x)),
+        y_min=y_min,
+        y_max=y_max,
+        y_min_positive=y_min_positive,
+        y_block_min=y_block_min,
+        y_block_max=y_block_max,
+        y_block_min_positive=y_block_min_positive,
+    )
+
+
+def sliced_min_max(
+    y: NDArray[np.float64],
+    stats: LineStats,
+    piece: slice,
+    positive_only: bool = False,
+) -> tuple[float, float]:
+    # take the blocks fully within the piece from the cache, and look through the edges only
+    start: int
+    stop: int
+    start, stop, _ = piece.indices(y.size)
+    first_block: int = -(-start // _BLOCK_SIZE)
+    last_block: int = min(stop // _BLOCK_SIZE, stats.y_block_min.size)
+    edges: list[NDArray[np.float64]]
+    min_y: float = np.nan
+    max_y: float = np.nan
+    if first_block < last_block:
+        edges = [y[start : first_block * _BLOCK_SIZE], y[last_block * _BLOCK_SIZE : stop]]
+        y_block_min: NDArray[np.float64] = stats.y_block_min_positive if positive_only else stats.y_block_min
+        min_y = nan_min_max(y_block_min[first_block:last_block])[0]
+        max_y = nan_min_max(stats.y_block_max[first_block:last_block])[1]
+    else:
+        edges = [y[start:stop]]
+    edge: NDArray[np.float64]
+    for edge in edges:
+        if positive_only:
+            edge = edge[edge > 0.0]
+        edge_min: float
+        edge_max: float
+        edge_min, edge_max = nan_min_max(edge)
+        min_y = np.fmin(min_y, edge_min)
+        max_y = np.fmax(max_y, edge_max)
+    if positive_only and not max_y > 0.0:
+        return np.nan, np.nan
+    return float(min_y), float(max_y)
+
+
+def visible_slice(
+    x: NDArray[np.float64],
+    x_min: float,
+    x_max: float,
+    x_sorted: bool,
+) -> slice | NDArray[np.bool_]:
+    if x_sorted:
+        # the time axis is monotonic, so the visible points form a contiguous view; no mask is needed
+        return slice(
+            int(np.searchsorted(x, x_min, side="left")),
+            int(np.searchsorted(x, x_max, side="right")),
+        )
+    # build the mask chunk by chunk with a single small temporary instead of two full-size ones
+    mask: NDArray[np.bool_] = np.empty(x.shape, dtype=np.bool_)
+    condition_buffer: NDArray[np.bool_] = np.empty(min(x.size, _CACHE_FRIENDLY_CHUNK_SIZE), dtype=np.bool_)
+    start: int
+    for start in range(0, x.size, _CACHE_FRIENDLY_CHUNK_SIZE):
+        x_chunk: NDArray[np.float64] = x[start : start + _CACHE_FRIENDLY_CHUNK_SIZE]
+        mask_chunk: NDArray[np.bool_] = mask[start : start + _CACHE_FRIENDLY_CHUNK_SIZE]
+        condition: NDArray[np.bool_] = condition_buffer[: x_chunk.size]
+        np.greater_equal(x_chunk, x_min, out=mask_chunk)
+        np.less_equal(x_chunk, x_max, out=condition)
+        mask_chunk &= condition
+    return mask
+
+
+def masked_min_max(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    x_min: float,
+    x_max: float,
+    positive_only: bool = False,
+) -> tuple[float, float]:
+    # the bounds of `y` where `x_min <= x <= x_max` for unsorted `x`;
+    # the mask is built chunk by chunk in reused buffers, so it never leaves the CPU cache
+    min_y: float = np.nan
+    max_y: float = np.nan
+    mask_buffer: NDArray[np.bool_] = np.empty(min(x.size, _CACHE_FRIENDLY_CHUNK_SIZE), dtype=np.bool_)
+    condition_buffer: NDArray[np.bool_] = np.empty_like(mask_buffer)
+    start: int
+    for start in range(0, x.size, _CACHE_FRIENDLY_CHUNK_SIZE):
+        x_chunk: NDArray[np.float64] = x[start : start + _CACHE_FRIENDLY_CHUNK_SIZE]
+        y_chunk: NDArray[np.float64] = y[start : start + _CACHE_FRIENDLY_CHUNK_SIZE]
+        mask: NDArray[np.bool_] = mask_buffer[: x_chunk.size]
+        condition: NDArray[np.bool_] = condition_buffer[: x_chunk.size]
+        np.greater_equal(x_chunk, x_min, out=mask)
+        np.less_equal(x_chunk, x_max, out=condition)
+        mask &= condition
+        if positive_only:
+            np.greater(y_chunk, 0.0, out=condition)
+            mask &= condition
+        y_piece: NDArray[np.float64] = y_chunk[mask]
+        if y_piece.size:
+            min_y = np.fmin(min_y, np.fmin.reduce(y_piece))
+            max_y = np.fmax(max_y, np.fmax.reduce(y_piece))
+    return float(min_y), float(max_y)
+
+
 class Plot(QtWidgets.QWidget):
+    _mouseMovedOverView: ClassVar[QtCore.Signal] = QtCore.Signal(QtCore.QPointF, name="mouseMovedOverView")
+
     def __init__(self, parent: QtWidgets.QWidget | None = None, *args: Any) -> None:
         super().__init__(parent, *args)
 
@@ -51,9 +254,16 @@ class Plot(QtWidgets.QWidget):
 
         plot: PlotWidget = PlotWidget(self)
         self.lines: list[PlotDataItem] = []
+        self._lines_stats: list[LineStats] = []
+        self._downsampling: bool = True
 
-        cursor_balloon: TextItem = TextItem()
-        plot.addItem(cursor_balloon, True)  # ignore bounds
+        # a plain widget over the plot is painted without invalidating the scene on every mouse move
+        cursor_balloon: QtWidgets.QLabel = QtWidgets.QLabel(plot.viewport())
+        cursor_balloon.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        cursor_balloon.setVisible(False)
+        self._plot_widget: PlotWidget = plot
+        self._cursor_balloon: QtWidgets.QLabel = cursor_balloon
+        self._use_open_gl: bool = False
 
         self.canvas: PlotItem = plot.getPlotItem()
         self.canvas.setAxisItems({"bottom": DateAxisItem()})
@@ -67,7 +277,9 @@ class Plot(QtWidgets.QWidget):
                 ax = ax_d["item"]
                 ax.setPen(foreground_color)
                 ax.setTextPen(foreground_color)
-            cursor_balloon.setColor(foreground_color)
+            balloon_palette: QtGui.QPalette = cursor_balloon.palette()
+            balloon_palette.setColor(QtGui.QPalette.ColorRole.WindowText, mkColor(foreground_color))
+            cursor_balloon.setPalette(balloon_palette)
 
         if is_dark:
             set_colors("k", "d")
@@ -75,10 +287,16 @@ class Plot(QtWidgets.QWidget):
             set_colors("w", "k")
 
         def on_view_all_triggered() -> None:
-            if not self.lines:
+            visible_lines_stats: list[LineStats] = [
+                stats for line, stats in zip(self.lines, self._lines_stats) if line.isVisible()
+            ]
+            if not visible_lines_stats:
+                return
+            # the lines without data have NaN bounds, which `fmin` and `fmax` skip
+            min_x: float = float(np.fmin.reduce([s.x_min for s in visible_lines_stats]))
+            max_x: float = float(np.fmax.reduce([s.x_max for s in visible_lines_stats]))
+            if np.isnan(min_x) or np.isnan(max_x):
                 return
-            min_x: float = min(line.xData[0] for line in self.lines if line.xData is not None and line.xData.size)
-            max_x: float = min(line.xData[-1] for line in self.lines if line.xData is not None and line.xData.size)
             self.canvas.vb.autoRange(padding=0.0)
             self.canvas.vb.setXRange(min_x, max_x, padding=0.0)
 
@@ -116,51 +334,69 @@ class Plot(QtWidgets.QWidget):
         self.end_time.clearMinimumDateTime()
         self.end_time.clearMaximumDateTime()
 
+        def hide_cursor_balloon() -> None:
+            # drop the pending position, or the rate-limited handler shows the balloon again
+            self._mouse_moved_signal_proxy.timer.stop()
+            self._mouse_moved_signal_proxy.args = None
+            cursor_balloon.setVisible(False)
+
+        def on_scene_mouse_moved(pos: QtCore.QPointF) -> None:
+            # pass only the events the balloon is shown for to the rate-limited handler
+            if self.canvas.vb.sceneBoundingRect().contains(pos):
+                self._mouseMovedOverView.emit(pos)
+            elif cursor_balloon.isVisible() or self._mouse_moved_signal_proxy.args is not None:
+                hide_cursor_balloon()
+
         def on_mouse_moved(event: tuple[QtCore.QPointF]) -> None:
             pos: QtCore.QPointF = event[0]
-            if plot.sceneBoundingRect().contains(pos):
-                point: QtCore.QPointF = self.canvas.vb.mapSceneToView(pos)
-                if plot.visibleRange().contains(point):
-                    cursor_balloon.setPos(point)
-                    x: float = point.x()
-                    y: float = point.y()
-                    if self.canvas.axes["left"]["item"].logMode:
-                        y = 10**y
-                    # don't use `datetime.fromtimestamp` here directly to avoid OSError on Windows when x < 0
-                    cursor_balloon.setText(f"{_THE_BEGINNING_OF_TIME + timedelta(seconds=x)}\n{y}")
-                    balloon_border: QtCore.QRectF = cursor_balloon.boundingRect()
-                    sx: float
-                    sy: float
-                    sx, sy = self.canvas.vb.viewPixelSize()
-                    balloon_width: float = balloon_border.width() * sx
-                    balloon_height: float = balloon_border.height() * sy
-                    anchor_x: float = 0.0 if point.x() - plot.visibleRange().left() < balloon_width else 1.0
-                    anchor_y: float = 0.0 if plot.visibleRange().bottom() - point.y() < balloon_height else 1.0
-                    cursor_balloon.setAnchor((anchor_x, anchor_y))
-                    cursor_balloon.setVisible(True)
-                else:
-                    cursor_balloon.setVisible(False)
-            else:
+            if self._view_rect is None:
+                self._view_rect = plot.mapFromScene(self.canvas.vb.sceneBoundingRect()).boundingRect()
+            view_rect: QtCore.QRect = self._view_rect
+            cursor: QtCore.QPoint = plot.mapFromScene(pos)
+            if not view_rect.contains(cursor):
                 cursor_balloon.setVisible(False)
+                return
+            point: QtCore.QPointF = self.canvas.vb.mapSceneToView(pos)
+            x: float = point.x()
+            y: float = point.y()
+            if self.canvas.axes["left"]["item"].logMode:
+                y = 10**y
+            balloon_text: str = f"{timestamp_to_text(x)}\n{y}"
+            if balloon_text != cursor_balloon.text():
+                cursor_balloon.setText(balloon_text)
+                cursor_balloon.adjustSize()
+            # put the balloon to the upper left of the cursor unless it gets out of the view there
+            balloon_x: int = cursor.x() - cursor_balloon.width()
+            balloon_y: int = cursor.y() - cursor_balloon.height()
+            if balloon_x < view_rect.left():
+                balloon_x = cursor.x()
+            if balloon_y < view_rect.top():
+                balloon_y = cursor.y()
+            cursor_balloon.move(balloon_x, balloon_y)
+            cursor_balloon.setVisible(True)
+
+        def on_view_transform_changed(*_: Any) -> None:
+            # the view geometry changes only when the view is zoomed or resized, not when the mouse moves
+            self._view_rect = None
 
         def on_lim_changed(arg: tuple[PlotWidget, list[list[float]]]) -> None:
             rect: list[list[float]] = arg[1]
             x_lim: list[float]
             y_lim: list[float]
             x_lim, y_lim = rect
-            self.start_time.blockSignals(True)
-            self.end_time.blockSignals(True)
-            self.time_span.blockSignals(True)
-            self.start_time.setDateTime(QtCore.QDateTime.fromMSecsSinceEpoch(round(min(x_lim) * 1000)))
-            self.end_time.setDateTime(QtCore.QDateTime.fromMSecsSinceEpoch(round(max(x_lim) * 1000)))
-            self.time_span.from_two_q_date_time(self.start_time.dateTime(), self.end_time.dateTime())
-            self.time_span.blockSignals(False)
-            self.end_time.blockSignals(False)
-            self.start_time.blockSignals(False)
+            start_time: QtCore.QDateTime = QtCore.QDateTime.fromMSecsSinceEpoch(round(min(x_lim) * 1000))
+            end_time: QtCore.QDateTime = QtCore.QDateTime.fromMSecsSinceEpoch(round(max(x_lim) * 1000))
+            with QtCore.QSignalBlocker(self.start_time), QtCore.QSignalBlocker(self.end_time):
+                if start_time != self.start_time.dateTime():
+                    self.start_time.setDateTime(start_time)
+                if end_time != self.end_time.dateTime():
+                    self.end_time.setDateTime(end_time)
+            # `TimeSpanEdit` emits no signals when its value is set programmatically
+            self.time_span.from_two_q_date_time(start_time, end_time)
+            self._x_range_from_time_edits = (start_time.toMSecsSinceEpoch() * 1e-3, end_time.toMSecsSinceEpoch() * 1e-3)
 
         def on_plot_left(event: QtCore.QEvent) -> None:
-            self._mouse_moved_signal_proxy.flush()
-            cursor_balloon.setVisible(False)
+            hide_cursor_balloon()
             event.accept()
 
         def on_mouse_clicked(event: MouseClickEvent) -> None:
@@ -168,9 +404,10 @@ class Plot(QtWidgets.QWidget):
                 self.auto_range_y()
             event.accept()
 
+        plot.scene().sigMouseMoved.connect(on_scene_mouse_moved)
         self._mouse_moved_signal_proxy: SignalProxy = SignalProxy(
-            plot.scene().sigMouseMoved,
-            rateLimit=10,
+            self._mouseMovedOverView,
+            rateLimit=_CURSOR_RATE_LIMIT,
             slot=on_mouse_moved,
         )
         self._axis_range_changed_signal_proxy: SignalProxy = SignalProxy(
@@ -179,53 +416,57 @@ class Plot(QtWidgets.QWidget):
             slot=on_lim_changed,
         )
         self._last_time_range_rolled: datetime = datetime.fromtimestamp(0)
+        self._x_range_from_time_edits: tuple[float, float] = (np.nan, np.nan)
+        self._view_rect: QtCore.QRect | None = None
+        self.canvas.vb.sigRangeChanged.connect(on_view_transform_changed)
+        self.canvas.vb.sigTransformChanged.connect(on_view_transform_changed)
         plot.leaveEvent = on_plot_left
         plot.scene().sigMouseClicked.connect(on_mouse_clicked)
 
+        def set_x_range_from_time_edits() -> None:
+            # the timer is restarted by every edit, so a burst of edits results in a single view update
+            self._x_range_timer.start()
+
+        def on_x_range_timer_timeout() -> None:
+            # `toMSecsSinceEpoch` spares creating a `datetime` and looking up the time zone
+            x_range: tuple[float, float] = (
+                self.start_time.dateTime().toMSecsSinceEpoch() * 1e-3,
+                self.end_time.dateTime().toMSecsSinceEpoch() * 1e-3,
+            )
+            if x_range != self._x_range_from_time_edits:
+                self._x_range_from_time_edits = x_range
+                self.canvas.vb.setXRange(*x_range, padding=0.0)
+
         def on_start_time_changed(new_time: QtCore.QDateTime) -> None:
-            self.time_span.blockSignals(True)
             self.time_span.from_two_q_date_time(new_time, self.end_time.dateTime())
-            self.time_span.blockSignals(False)
-            self.canvas.vb.setXRange(
-                self.start_time.dateTime().toPython().timestamp(),
-                self.end_time.dateTime().toPython().timestamp(),
-                padding=0.0,
-            )
+            set_x_range_from_time_edits()
 
         def on_end_time_changed(new_time: QtCore.QDateTime) -> None:
-            self.start_time.blockSignals(True)
-            if new_time.addMSecs(-round(self.time_span.total_seconds * 1000)) >= self.start_time.minimumDateTime():
-                self.start_time.setDateTime(new_time.addMSecs(-round(self.time_span.total_seconds * 1000)))
-            else:
-                self.start_time.setDateTime(self.start_time.minimumDateTime())
-                self.time_span.blockSignals(True)
-                self.time_span.from_two_q_date_time(self.start_time.dateTime(), self.end_time.dateTime())
-                self.time_span.blockSignals(False)
-            self.start_time.blockSignals(False)
-            self.canvas.vb.setXRange(
-                self.start_time.dateTime().toPython().timestamp(),
-                self.end_time.dateTime().toPython().timestamp(),
-                padding=0.0,
-            )
+            new_start_time: QtCore.QDateTime = new_time.addMSecs(-round(self.time_span.total_seconds * 1000))
+            with QtCore.QSignalBlocker(self.start_time):
+                if new_start_time >= self.start_time.minimumDateTime():
+                    if new_start_time != self.start_time.dateTime():
+                        self.start_time.setDateTime(new_start_time)
+                else:
+                    self.start_time.setDateTime(self.start_time.minimumDateTime())
+                    self.time_span.from_two_q_date_time(self.start_time.dateTime(), self.end_time.dateTime())
+            set_x_range_from_time_edits()
 
         def on_time_span_changed(delta: timedelta) -> None:
-            self.start_time.blockSignals(True)
-            if (
-                self.end_time.dateTime().addMSecs(-round(delta.total_seconds() * 1000))
-                >= self.start_time.minimumDateTime()
-            ):
-                self.start_time.setDateTime(self.end_time.dateTime().addMSecs(-round(delta.total_seconds() * 1000)))
-            else:
-                self.start_time.setDateTime(self.start_time.minimumDateTime())
-                self.time_span.blockSignals(True)
-                self.time_span.from_two_q_date_time(self.start_time.dateTime(), self.end_time.dateTime())
-                self.time_span.blockSignals(False)
-            self.start_time.blockSignals(False)
-            self.canvas.vb.setXRange(
-                self.start_time.dateTime().toPython().timestamp(),
-                self.end_time.dateTime().toPython().timestamp(),
-                padding=0.0,
-            )
+            new_start_time: QtCore.QDateTime = self.end_time.dateTime().addMSecs(-round(delta.total_seconds() * 1000))
+            with QtCore.QSignalBlocker(self.start_time):
+                if new_start_time >= self.start_time.minimumDateTime():
+                    if new_start_time != self.start_time.dateTime():
+                        self.start_time.setDateTime(new_start_time)
+                else:
+                    self.start_time.setDateTime(self.start_time.minimumDateTime())
+                    self.time_span.from_two_q_date_time(self.start_time.dateTime(), self.end_time.dateTime())
+            set_x_range_from_time_edits()
+
+        self._x_range_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._x_range_timer.setSingleShot(True)
+        self._x_range_timer.setInterval(0)
+        self._x_range_timer.timeout.connect(on_x_range_timer_timeout)
 
         self.start_time.dateTimeChanged.connect(on_start_time_changed)
         self.end_time.dateTimeChanged.connect(on_end_time_changed)
@@ -235,33 +476,36 @@ class Plot(QtWidgets.QWidget):
         if not self.lines:
             return
         line: PlotDataItem
-        visible_data: list[NDArray[np.float64]] = []
+        stats: LineStats
         x_min: float
         x_max: float
-        y_min: float
-        y_max: float
-        [[x_min, x_max], [y_min, y_max]] = self.canvas.vb.viewRange()
-        for line in self.lines:
+        [[x_min, x_max], _] = self.canvas.vb.viewRange()
+        log_mode_y: bool = self.canvas.axes["left"]["item"].logMode
+        min_y: float = np.nan
+        max_y: float = np.nan
+        for line, stats in zip(self.lines, self._lines_stats):
             if not line.isVisible() or line.yData is None or not line.yData.size:
                 continue
-            visible_data_piece: NDArray[np.float64] = line.yData[(line.xData >= x_min) & (line.xData <= x_max)]
-            if np.any((visible_data_piece >= y_min) & (visible_data_piece <= y_max)):
-                visible_data.append(visible_data_piece)
-        if not visible_data:
+            piece_min: float
+            piece_max: float
+            if stats.x_sorted:
+                visible_part: slice = cast(slice, visible_slice(line.xData, x_min, x_max, x_sorted=True))
+                piece_min, piece_max = sliced_min_max(line.yData, stats, visible_part, positive_only=log_mode_y)
+            else:
+                piece_min, piece_max = masked_min_max(line.xData, line.yData, x_min, x_max, positive_only=log_mode_y)
+            min_y = np.fmin(min_y, piece_min)
+            max_y = np.fmax(max_y, piece_max)
+        if np.isnan(min_y) or np.isnan(max_y):
             return
-        min_y: float
-        max_y: float
-        if self.canvas.axes["left"]["item"].logMode:
-            positive_data: list[NDArray[np.float64]] = [d[d > 0] for d in visible_data]
-            min_y = np.log10(min(cast(float, np.nanmin(d)) for d in positive_data))
-            max_y = np.log10(max(cast(float, np.nanmax(d)) for d in positive_data))
-        else:
-            min_y = min(cast(float, np.nanmin(d)) for d in visible_data)
-            max_y = max(cast(float, np.nanmax(d)) for d in visible_data)
+        if log_mode_y:
+            min_y = np.log10(min_y)
+            max_y = np.log10(max_y)
         self.canvas.vb.setYRange(min_y, max_y, padding=0.0)
 
     def clear(self) -> None:
         self.canvas.clearPlots()
+        self.lines.clear()
+        self._lines_stats.clear()
 
     def plot(
         self,
@@ -276,24 +520,21 @@ class Plot(QtWidgets.QWidget):
         if self.lines:
             self.clear()
 
-        visibility = list(visibility)
-        y_column_names = list(y_column_names)
+        y_column_names = tuple(y_column_names)
+        # `colors` and `visibility` are likely to be generators, so they can be consumed only once
+        colors = tuple(colors) or (CONFIG_OPTIONS["foreground"],)
+        visibility = tuple(visibility)
 
         if len(visibility) < len(y_column_names):
-            visibility += [True] * (len(y_column_names) - len(visibility))
+            visibility += (True,) * (len(y_column_names) - len(visibility))
 
         y_column_name: str | None
         color: QtGui.QColor
         visible: bool
-        y_column_names = tuple(y_column_names)
         if x_column_name is not None and all(y_column_names):
-            x_column: int = data_model.header.index(x_column_name)
-            for y_column_name, color, visible in zip(
-                y_column_names,
-                cycle(colors or [CONFIG_OPTIONS["foreground"]]),
-                visibility,
-            ):
-                y_column: int = data_model.header.index(cast(str, y_column_name))  # no Nones here
+            x_column: int = data_model.column_index(x_column_name)
+            for y_column_name, color, visible in zip(y_column_names, cycle(colors), visibility):
+                y_column: int = data_model.column_index(cast(str, y_column_name))  # no Nones here
                 self.lines.append(
                     self.canvas.plot(
                         data_model[x_column],
@@ -301,16 +542,16 @@ class Plot(QtWidgets.QWidget):
                         pen=color,
                     )
                 )
-                self.lines[-1].curve.opts["pen"].setCosmetic(True)
+                self._set_up_line(self.lines[-1])
                 self.lines[-1].setVisible(visible)
+                self._lines_stats.append(line_stats(self.lines[-1].xData, self.lines[-1].yData))
             self.canvas.vb.setXRange(data_model[x_column][0], data_model[x_column][-1], padding=0.0)
         else:
-            for y_column_name, color, visible in zip(
-                y_column_names, cycle(colors or [CONFIG_OPTIONS["foreground"]]), visibility
-            ):
+            for y_column_name, color, visible in zip(y_column_names, cycle(colors), visibility):
                 self.lines.append(self.canvas.plot([], [], pen=color))
-                self.lines[-1].curve.opts["pen"].setCosmetic(True)
+                self._set_up_line(self.lines[-1])
                 self.lines[-1].setVisible(visible)
+                self._lines_stats.append(LineStats())
         # restore log state if set
         log_mode_y: bool = self.canvas.getAxis("left").logMode
         if log_mode_y:
@@ -318,27 +559,24 @@ class Plot(QtWidgets.QWidget):
                 if hasattr(i, "setLogMode"):
                     i.setLogMode(False, log_mode_y)
 
-        good_lines: list[PlotDataItem] = [
-            line
-            for line, visible in zip(self.lines, visibility)
-            if (visible and line.yData is not None and line.yData.size and not np.all(np.isnan(line.yData)))
+        # the bounds are NaN for the lines with no data or only NaNs in it
+        good_lines_stats: list[LineStats] = [
+            stats for stats, visible in zip(self._lines_stats, visibility) if visible and not np.isnan(stats.y_min)
         ]
-        if good_lines:
-            data: list[NDArray[np.float64]] = [line.yData for line in good_lines]
+        if good_lines_stats:
             min_y: float
             max_y: float
             if self.canvas.axes["left"]["item"].logMode:
-                positive_data: list[NDArray[np.float64]] = [d[d > 0] for d in data]
-                min_y = np.log10(min(cast(float, np.nanmin(d)) for d in positive_data))
-                max_y = np.log10(max(cast(float, np.nanmax(d)) for d in positive_data))
+                min_y = np.log10(np.fmin.reduce([s.y_min_positive for s in good_lines_stats]))
+                max_y = np.log10(np.fmax.reduce([s.y_max for s in good_lines_stats]))
             else:
-                min_y = min(cast(float, np.nanmin(d)) for d in data)
-                max_y = max(cast(float, np.nanmax(d)) for d in data)
+                min_y = min(s.y_min for s in good_lines_stats)
+                max_y = max(s.y_max for s in good_lines_stats)
             self.canvas.vb.setYRange(min_y, max_y, padding=0.0)
 
-        self.start_time.setEnabled(bool(good_lines))
-        self.end_time.setEnabled(bool(good_lines))
-        self.time_span.setEnabled(bool(good_lines))
+        self.start_time.setEnabled(bool(good_lines_stats))
+        self.end_time.setEnabled(bool(good_lines_stats))
+        self.time_span.setEnabled(bool(good_lines_stats))
 
     def replot(
         self,
@@ -362,8 +600,8 @@ class Plot(QtWidgets.QWidget):
             color.setCosmetic(True)
         else:
             color = mkPen(color, cosmetic=True)
-        x_column: int = data_model.header.index(x_column_name)
-        y_column: int = data_model.header.index(y_column_name)
+        x_column: int = data_model.column_index(x_column_name)
+        y_column: int = data_model.column_index(y_column_name)
 
         if (
             roll
@@ -376,15 +614,60 @@ class Plot(QtWidgets.QWidget):
             self.canvas.vb.setXRange(min(x_axis.range) + shift, max(x_axis.range) + shift, padding=0.0)
             self._last_time_range_rolled = datetime.now()
 
-        self.lines[index].setData(
-            data_model[x_column],
-            normalize(data_model[y_column]) if normalized else data_model[y_column],
-            pen=color,
-        )
+        line: PlotDataItem = self.lines[index]
+        x_data: NDArray[np.float64] = data_model[x_column]
+        y_data: NDArray[np.float64] = normalize(data_model[y_column]) if normalized else data_model[y_column]
+        if same_data(line.xData, x_data) and same_data(line.yData, y_data):
+            # comparing the arrays is much cheaper than building the curve again, so rebuild it only if needed
+            if line.opts["pen"] != color:
+                line.setPen(color)
+            return
+        line.setData(x_data, y_data, pen=color)
+        self._lines_stats[index] = line_stats(line.xData, line.yData)
+
+    def _set_up_line(self, line: PlotDataItem) -> None:
+        line.curve.opts["pen"].setCosmetic(True)
+        # no `DeviceCoordinateCache` for the curve: the cursor balloon is a widget on the viewport,
+        # so moving the mouse doesn't repaint the scene, while every pan or zoom would render the pixmap anew
+        # draw about two points per pixel of the visible part only instead of the whole line
+        line.setDownsampling(auto=self._downsampling, method="peak")
+        line.setClipToView(self._downsampling)
 
     def set_line_visible(self, index: int, visible: bool) -> None:
         self.lines[index].setVisible(visible)
 
+    @property
+    def downsampling(self) -> bool:
+        return self._downsampling
+
+    @downsampling.setter
+    def downsampling(self, new_value: bool) -> None:
+        self._downsampling = new_value
+        line: PlotDataItem
+        for line in self.lines:
+            self._set_up_line(line)
+
+    @property
+    def use_open_gl(self) -> bool:
+        return self._use_open_gl
+
+    @use_open_gl.setter
+    def use_open_gl(self, new_value: bool) -> None:
+        if new_value == self._use_open_gl:
+            return
+        if new_value and not hasattr(QtWidgets, "QOpenGLWidget"):
+            return  # no OpenGL support in Qt; the viewport stays unchanged
+        # the old viewport gets deleted along with its children
+        self._cursor_balloon.setParent(None)
+        try:
+            self._plot_widget.useOpenGL(new_value)
+        except Exception:  # pyqtgraph raises a plain `Exception` or worse when OpenGL is unavailable
+            pass
+        else:
+            self._use_open_gl = new_value
+        self._cursor_balloon.setParent(self._plot_widget.viewport())
+        self._cursor_balloon.setVisible(False)
+
     @property
     def view_range(self) -> list[list[float]]:
         return self.canvas.vb.viewRange()
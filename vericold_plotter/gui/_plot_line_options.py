@@ -33,6 +33,7 @@ class PlotLineOptions(QtWidgets.QWidget):
         self._index: int = PlotLineOptions._count
 
         self.settings: Settings = settings
+        self._items: tuple[str, ...] | None = None
 
         self.layout: QtWidgets.QHBoxLayout = QtWidgets.QHBoxLayout(self)
         self.check_box: QtWidgets.QCheckBox = QtWidgets.QCheckBox(self)
@@ -52,24 +53,23 @@ class PlotLineOptions(QtWidgets.QWidget):
         PlotLineOptions._count += 1
 
     def set_items(self, items: Sequence[str]) -> None:
+        if self._items == tuple(items):
+            return  # e.g., the same file is reloaded; the current choice is still valid
+        self._items = tuple(items)
         self.setEnabled(bool(items))
-        self.options.blockSignals(True)
-        self.options.clear()
-        self.options.addItems(items)
-        if self._index < len(self.settings.data_series_names) and self.settings.data_series_names[self._index] in items:
-            self.options.setCurrentText(self.settings.data_series_names[self._index])
-        self.color_selector.blockSignals(True)
-        self.color_selector.setColor(
-            self.settings.line_colors.get(
-                self.options.currentText(),
-                PlotLineOptions.DEFAULT_COLOR,
-            )
-        )
-        self.color_selector.blockSignals(False)
-        self.check_box.blockSignals(True)
-        self.check_box.setChecked(self.settings.line_enabled.get(self.options.currentText(), False))
-        self.check_box.blockSignals(False)
-        self.options.blockSignals(False)
+        with QtCore.QSignalBlocker(self.options), QtCore.QSignalBlocker(self.color_selector), QtCore.QSignalBlocker(
+            self.check_box
+        ):
+            self.options.clear()
+            self.options.addItems(items)
+            if (
+                self._index < len(self.settings.data_series_names)
+                and self.settings.data_series_names[self._index] in items
+            ):
+                self.options.setCurrentText(self.settings.data_series_names[self._index])
+            current_text: str = self.options.currentText()
+            self.color_selector.setColor(self.settings.line_colors.get(current_text, PlotLineOptions.DEFAULT_COLOR))
+            self.check_box.setChecked(self.settings.line_enabled.get(current_text, False))
 
     @property
     def index(self) -> int:
@@ -92,6 +92,8 @@ class PlotLineOptions(QtWidgets.QWidget):
         self.toggled.emit(self._index, new_state)
 
     def on_combo_changed(self, new_text: str) -> None:
+        if self._index >= len(self.settings.data_series_names):
+            self.settings.data_series_names.extend([""] * (self._index + 1 - len(self.settings.data_series_names)))
         self.settings.data_series_names[self._index] = new_text
         self.color_selector.setColor(
             self.settings.line_colors.get(new_text, PlotLineOptions.DEFAULT_COLOR),
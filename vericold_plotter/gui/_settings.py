@@ -25,48 +25,79 @@ class Settings(QtCore.QSettings):
         ";": QtWidgets.QApplication.translate("csv separator", r"semicolon (;)"),
         " ": QtWidgets.QApplication.translate("csv separator", r"space ( )"),
     }
+    _LINE_END_KEYS: ClassVar[tuple[str, ...]] = tuple(LINE_ENDS)
+    _CSV_SEPARATOR_KEYS: ClassVar[tuple[str, ...]] = tuple(CSV_SEPARATORS)
+    _DEFAULT_LINE_END_INDEX: ClassVar[int] = _LINE_END_KEYS.index(os.linesep)
+    _DEFAULT_CSV_SEPARATOR_INDEX: ClassVar[int] = _CSV_SEPARATOR_KEYS.index("\t")
 
     def __init__(self, *args: Any) -> None:
         super().__init__(*args)
+        # the values read once; the setters write through, so they never get stale
+        self._cache: dict[str, Any] = dict()
         self.check_items_names: list[str] = []
         self.check_items_values: list[bool] = []
 
         self.line_colors: dict[str, QtGui.QColor] = dict()
         self.line_enabled: dict[str, bool] = dict()
-        self.data_series_names: dict[int, str] = dict()
+        self.data_series_names: list[str] = []
 
         self.beginGroup("plot")
         key: str
+        if not {"colors", "enabled"}.intersection(self.childGroups()):
+            # move the line settings stored as `<name> color` and `<name> enabled` by the former versions
+            for key in self.allKeys():
+                if key.endswith(" color"):
+                    self.setValue(f"colors/{key[:-6]}", self.value(key))
+                    self.remove(key)
+                elif key.endswith(" enabled"):
+                    self.setValue(f"enabled/{key[:-8]}", self.value(key, False, bool))
+                    self.remove(key)
+
+        # the names with slashes in them make subgroups, so not `childKeys` here
+        self.beginGroup("colors")
         for key in self.allKeys():
-            if key.endswith(" color"):
-                self.line_colors[key[:-6]] = cast(QtGui.QColor, self.value(key))
-            if key.endswith(" enabled"):
-                self.line_enabled[key[:-8]] = cast(bool, self.value(key, False, bool))
+            self.line_colors[key] = cast(QtGui.QColor, self.value(key))
+        self.endGroup()
+        self.beginGroup("enabled")
+        for key in self.allKeys():
+            self.line_enabled[key] = cast(bool, self.value(key, False, bool))
+        self.endGroup()
 
         i: int
         for i in range(self.beginReadArray("dataSeries")):
             self.setArrayIndex(i)
-            self.data_series_names[i] = cast(str, self.value("name"))
+            self.data_series_names.append(cast(str, self.value("name")))
         self.endArray()
         self.endGroup()
 
+        # what is stored already, so that `sync` writes only the changes
+        self._synced_line_colors: dict[str, QtGui.QColor] = dict(self.line_colors)
+        self._synced_line_enabled: dict[str, bool] = dict(self.line_enabled)
+        self._synced_data_series_names: list[str] = self.data_series_names.copy()
+
     def sync(self) -> None:
         self.beginGroup("plot")
         key: str
         color: QtGui.QColor
         enabled: bool
         for key, color in self.line_colors.items():
-            self.setValue(f"{key} color", color)
+            if self._synced_line_colors.get(key) != color:
+                self.setValue(f"colors/{key}", color)
         for key, enabled in self.line_enabled.items():
-            self.setValue(f"{key} enabled", enabled)
-
-        i: int
-        n: str
-        self.beginWriteArray("dataSeries", len(self.data_series_names))
-        for i, n in self.data_series_names.items():
-            self.setArrayIndex(i)
-            self.setValue("name", n)
-        self.endArray()
+            if self._synced_line_enabled.get(key) != enabled:
+                self.setValue(f"enabled/{key}", enabled)
+        self._synced_line_colors = dict(self.line_colors)
+        self._synced_line_enabled = dict(self.line_enabled)
+
+        if self._synced_data_series_names != self.data_series_names:
+            i: int
+            n: str
+            self.beginWriteArray("dataSeries", len(self.data_series_names))
+            for i, n in enumerate(self.data_series_names):
+                self.setArrayIndex(i)
+                self.setValue("name", n)
+            self.endArray()
+            self._synced_data_series_names = self.data_series_names.copy()
         self.endGroup()
 
         super().sync()
@@ -80,6 +111,8 @@ class Settings(QtCore.QSettings):
         return {
             self.tr("View"): {
                 self.tr("Translation file:"): ("translation_path",),
+                self.tr("Downsample and clip the lines to the view"): ("downsampling",),
+                self.tr("Render the plot with OpenGL"): ("use_open_gl",),
             },
             self.tr("Export"): {
                 self.tr("Line ending:"): (
@@ -97,136 +130,117 @@ class Settings(QtCore.QSettings):
 
     @property
     def line_end(self) -> str:
-        self.beginGroup("export")
-        v: int = cast(int, self.value("lineEnd", list(Settings.LINE_ENDS.keys()).index(os.linesep), int))
-        self.endGroup()
-        return list(Settings.LINE_ENDS.keys())[v]
+        if "line_end" not in self._cache:
+            v: int = cast(int, self.value("export/lineEnd", Settings._DEFAULT_LINE_END_INDEX, int))
+            self._cache["line_end"] = Settings._LINE_END_KEYS[v]
+        return self._cache["line_end"]
 
     @line_end.setter
     def line_end(self, new_value: str) -> None:
-        self.beginGroup("export")
-        self.setValue("lineEnd", list(Settings.LINE_ENDS.keys()).index(new_value))
-        self.endGroup()
+        self.setValue("export/lineEnd", Settings._LINE_END_KEYS.index(new_value))
+        self._cache["line_end"] = new_value
 
     @property
     def csv_separator(self) -> str:
-        self.beginGroup("export")
-        v: int = cast(int, self.value("csvSeparator", list(Settings.CSV_SEPARATORS.keys()).index("\t"), int))
-        self.endGroup()
-        return list(Settings.CSV_SEPARATORS.keys())[v]
+        if "csv_separator" not in self._cache:
+            v: int = cast(int, self.value("export/csvSeparator", Settings._DEFAULT_CSV_SEPARATOR_INDEX, int))
+            self._cache["csv_separator"] = Settings._CSV_SEPARATOR_KEYS[v]
+        return self._cache["csv_separator"]
 
     @csv_separator.setter
     def csv_separator(self, new_value: str) -> None:
-        self.beginGroup("export")
-        self.setValue("csvSeparator", list(Settings.CSV_SEPARATORS.keys()).index(new_value))
-        self.endGroup()
+        self.setValue("export/csvSeparator", Settings._CSV_SEPARATOR_KEYS.index(new_value))
+        self._cache["csv_separator"] = new_value
 
     @property
     def translation_path(self) -> Path | None:
-        self.beginGroup("translation")
-        v: str = cast(str, self.value("filePath", "", str))
-        self.endGroup()
-        return Path(v) if v else None
+        if "translation_path" not in self._cache:
+            v: str = cast(str, self.value("translation/filePath", "", str))
+            self._cache["translation_path"] = Path(v) if v else None
+        return self._cache["translation_path"]
 
     @translation_path.setter
     def translation_path(self, new_value: Path | None) -> None:
-        self.beginGroup("translation")
-        self.setValue("filePath", str(new_value) if new_value is not None else "")
-        self.endGroup()
+        self.setValue("translation/filePath", str(new_value) if new_value is not None else "")
+        self._cache["translation_path"] = new_value
+
+    @property
+    def downsampling(self) -> bool:
+        if "downsampling" not in self._cache:
+            self._cache["downsampling"] = cast(bool, self.value("plot/downsampling", True, bool))
+        return self._cache["downsampling"]
+
+    @downsampling.setter
+    def downsampling(self, new_value: bool) -> None:
+        self.setValue("plot/downsampling", new_value)
+        self._cache["downsampling"] = new_value
+
+    @property
+    def use_open_gl(self) -> bool:
+        if "use_open_gl" not in self._cache:
+            self._cache["use_open_gl"] = cast(bool, self.value("plot/useOpenGL", False, bool))
+        return self._cache["use_open_gl"]
+
+    @use_open_gl.setter
+    def use_open_gl(self, new_value: bool) -> None:
+        self.setValue("plot/useOpenGL", new_value)
+        self._cache["use_open_gl"] = new_value
 
     @property
     def argument(self) -> str:
-        self.beginGroup("plot")
-        v: str = cast(str, self.value("xAxis"))
-        self.endGroup()
-        return v
+        if "argument" not in self._cache:
+            self._cache["argument"] = cast(str, self.value("plot/xAxis"))
+        return self._cache["argument"]
 
     @argument.setter
     def argument(self, new_value: str) -> None:
-        self.beginGroup("plot")
-        self.setValue("xAxis", new_value)
-        self.endGroup()
+        self.setValue("plot/xAxis", new_value)
+        self._cache["argument"] = new_value
 
     @property
     def opened_file_name(self) -> str:
-        try:
-            self.beginGroup("location")
-            return cast(str, self.value("open", str(Path.cwd()), str))
-        finally:
-            self.endGroup()
+        return cast(str, self.value("location/open", str(Path.cwd()), str))
 
     @opened_file_name.setter
     def opened_file_name(self, filename: str) -> None:
-        self.beginGroup("location")
-        self.setValue("open", filename)
-        self.endGroup()
+        self.setValue("location/open", filename)
 
     @property
     def exported_file_name(self) -> str:
-        try:
-            self.beginGroup("location")
-            return cast(str, self.value("export", str(Path.cwd()), str))
-        finally:
-            self.endGroup()
+        return cast(str, self.value("location/export", str(Path.cwd()), str))
 
     @exported_file_name.setter
     def exported_file_name(self, filename: str) -> None:
-        self.beginGroup("location")
-        self.setValue("export", filename)
-        self.endGroup()
+        self.setValue("location/export", filename)
 
     @property
     def export_dialog_state(self) -> QtCore.QByteArray:
-        try:
-            self.beginGroup("location")
-            return cast(QtCore.QByteArray, self.value("exportDialogState", QtCore.QByteArray()))
-        finally:
-            self.endGroup()
+        return cast(QtCore.QByteArray, self.value("location/exportDialogState", QtCore.QByteArray()))
 
     @export_dialog_state.setter
     def export_dialog_state(self, state: QtCore.QByteArray) -> None:
-        self.beginGroup("location")
-        self.setValue("exportDialogState", state)
-        self.endGroup()
+        self.setValue("location/exportDialogState", state)
 
     @property
     def export_dialog_geometry(self) -> QtCore.QByteArray:
-        try:
-            self.beginGroup("location")
-            return cast(QtCore.QByteArray, self.value("exportDialogGeometry", QtCore.QByteArray()))
-        finally:
-            self.endGroup()
+        return cast(QtCore.QByteArray, self.value("location/exportDialogGeometry", QtCore.QByteArray()))
 
     @export_dialog_geometry.setter
     def export_dialog_geometry(self, state: QtCore.QByteArray) -> None:
-        self.beginGroup("location")
-        self.setValue("exportDialogGeometry", state)
-        self.endGroup()
+        self.setValue("location/exportDialogGeometry", state)
 
     @property
     def open_dialog_state(self) -> QtCore.QByteArray:
-        try:
-            self.beginGroup("location")
-            return cast(QtCore.QByteArray, self.value("openDialogState", QtCore.QByteArray()))
-        finally:
-            self.endGroup()
+        return cast(QtCore.QByteArray, self.value("location/openDialogState", QtCore.QByteArray()))
 
     @open_dialog_state.setter
     def open_dialog_state(self, state: QtCore.QByteArray) -> None:
-        self.beginGroup("location")
-        self.setValue("openDialogState", state)
-        self.endGroup()
+        self.setValue("location/openDialogState", state)
 
     @property
     def open_dialog_geometry(self) -> QtCore.QByteArray:
-        try:
-            self.beginGroup("location")
-            return cast(QtCore.QByteArray, self.value("openDialogGeometry", QtCore.QByteArray()))
-        finally:
-            self.endGroup()
+        return cast(QtCore.QByteArray, self.value("location/openDialogGeometry", QtCore.QByteArray()))
 
     @open_dialog_geometry.setter
     def open_dialog_geometry(self, state: QtCore.QByteArray) -> None:
-        self.beginGroup("location")
-        self.setValue("openDialogGeometry", state)
-        self.endGroup()
+        self.setValue("location/openDialogGeometry", state)
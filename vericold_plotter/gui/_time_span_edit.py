@@ -1,20 +1,35 @@
 # coding: utf-8
 from __future__ import annotations
 
+import math
+import re
+from bisect import bisect_left
 from datetime import timedelta
-from typing import ClassVar, cast
+from functools import partial
+from typing import Callable, ClassVar, Final, TypeVar, cast
 
 from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 
 __all__ = ["TimeSpanEdit"]
 
+_T = TypeVar("_T")
+
+_U_SHORT_MAX: Final[int] = 0xFFFF
+_U_LONG_LONG_MAX: Final[int] = 0xFFFFFFFFFFFFFFFF
+
 
 def _timedelta_to_text(delta: timedelta) -> str:
     days: int = delta.days
-    seconds: float = delta.seconds % 60 + 1e-6 * delta.microseconds
-    minutes: int = (delta.seconds // 60) % 60
-    hours: int = delta.seconds // 3600
-    seconds_str: str = f"{seconds:02.0f}" if abs(seconds % 1.0) < 0.001 else f"{seconds:06.3f}"
+    hours: int
+    minutes: int
+    whole_seconds: int
+    hours, whole_seconds = divmod(delta.seconds, 3600)
+    minutes, whole_seconds = divmod(whole_seconds, 60)
+    seconds_str: str
+    if delta.microseconds < 1000:
+        seconds_str = f"{whole_seconds:02d}"
+    else:
+        seconds_str = f"{whole_seconds + 1e-6 * delta.microseconds:06.3f}"
     if days > 0:
         return f"{days}:{hours:02d}:{minutes:02d}:{seconds_str}"
     elif hours > 0:
@@ -23,49 +38,176 @@ def _timedelta_to_text(delta: timedelta) -> str:
         return f"{minutes:02d}:{seconds_str}"
 
 
+def _invalid_characters_pattern(decimal_point: str) -> re.Pattern[str]:
+    return re.compile(f"[^0-9:{re.escape(decimal_point)}]")
+
+
+def _to_float(text: str) -> tuple[float, bool]:
+    # like `QLocale.toDouble`, which fails on an overflow
+    try:
+        value: float = float(text)
+    except ValueError:
+        return 0.0, False
+    if not math.isfinite(value):
+        return 0.0, False
+    return value, True
+
+
+def _to_int(text: str, limit: int) -> tuple[int, bool]:
+    # like `QLocale.toUShort` or `QLocale.toULongLong`, depending on the limit
+    try:
+        value: int = int(text)
+    except ValueError:
+        return 0, False
+    if value > limit:
+        return 0, False
+    return value, True
+
+
+def _digits_first(convert: Callable[[str], tuple[_T, bool]], limit: float) -> Callable[[str], tuple[_T | int, bool]]:
+    # ASCII digits are what is typed most of the time, and they need no locale to be parsed
+    def converted(text: str) -> tuple[_T | int, bool]:
+        if text.isdigit() and text.isascii():
+            value: int = int(text)
+            if value <= limit:
+                return value, True
+        return convert(text)
+
+    return converted
+
+
+def _cursor_position_at_place(text: str, cursor_position: int, place: int) -> int:
+    # move the cursor to the nearest position with `place` colons after it
+    colons: list[int] = [i for i, c in enumerate(text) if c == ":"]
+    if place > len(colons):
+        return 0
+    colons_after: int = len(colons) - bisect_left(colons, cursor_position)
+    if colons_after < place:
+        return colons[len(colons) - place]
+    if colons_after > place:
+        return colons[len(colons) - place - 1] + 1
+    return cursor_position
+
+
 class TimeSpanEdit(QtWidgets.QAbstractSpinBox):
     timeSpanChanged: ClassVar[QtCore.Signal] = QtCore.Signal(timedelta, name="timeSpanChanged")
 
-    _MAX_TEXT: ClassVar[str] = _timedelta_to_text(timedelta.max)
+    _STEP_NONE: ClassVar[QtWidgets.QAbstractSpinBox.StepEnabledFlag] = (
+        QtWidgets.QAbstractSpinBox.StepEnabledFlag.StepNone
+    )
+    _STEP_UP: ClassVar[QtWidgets.QAbstractSpinBox.StepEnabledFlag] = (
+        QtWidgets.QAbstractSpinBox.StepEnabledFlag.StepUpEnabled
+    )
+    _STEP_UP_AND_DOWN: ClassVar[QtWidgets.QAbstractSpinBox.StepEnabledFlag] = cast(
+        QtWidgets.QAbstractSpinBox.StepEnabledFlag,
+        QtWidgets.QAbstractSpinBox.StepEnabledFlag.StepDownEnabled
+        | QtWidgets.QAbstractSpinBox.StepEnabledFlag.StepUpEnabled,
+    )
+
+    _MAX_TEXT: ClassVar[str] = "999999999:23:59:60.000"  # `_timedelta_to_text(timedelta.max)`
+    _MAX_TEXT_WITH_SPACE: ClassVar[str] = _MAX_TEXT + " "
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
 
+        self._line_edit: QtWidgets.QLineEdit = self.lineEdit()
+        self._size_hint: QtCore.QSize | None = None
+        self._minimum_size_hint: QtCore.QSize | None = None
+
         self.setAlignment(cast(QtCore.Qt.AlignmentFlag, QtCore.Qt.AlignmentFlag.AlignRight))
 
         self._last_correct_delta: timedelta = timedelta(days=1)
+        # the text parsed last and the result, for the text is parsed many times while it stays the same
+        self._parsed_text: str | None = None
+        self._parsed_delta: timedelta = timedelta()
+        self._invalid_characters: re.Pattern[str]
+        self._to_double: Callable[[str], tuple[float, bool]]
+        self._to_u_short: Callable[[str], tuple[int, bool]]
+        self._to_u_long_long: Callable[[str], tuple[int, bool]]
+        self._set_up_locale()
+
+        # holding an arrow key or spinning the wheel steps many times in a row, yet the listeners need the last value
+        self._step_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._step_timer.setSingleShot(True)
+        self._step_timer.setInterval(0)
+        self._step_timer.timeout.connect(self._on_step_timer_timeout)
 
         self.editingFinished.connect(self._on_edit_finished)
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.Type.LocaleChange:
+            self._set_up_locale()
+            self._parsed_text = None  # the numbers are parsed with the locale
+        if event.type() in (QtCore.QEvent.Type.FontChange, QtCore.QEvent.Type.StyleChange):
+            # the size hints depend only on the font and the style, for the text measured is fixed
+            self._size_hint = None
+            self._minimum_size_hint = None
+        super().changeEvent(event)
+
+    def _set_up_locale(self) -> None:
+        locale: QtCore.QLocale = self.locale()
+        decimal_point: str = locale.decimalPoint()
+        self._invalid_characters = _invalid_characters_pattern(decimal_point)
+        if decimal_point == ".":
+            # the validator leaves only digits, colons, and the point in the text, so Python parses it the same way
+            self._to_double = _to_float
+            self._to_u_short = partial(_to_int, limit=_U_SHORT_MAX)
+            self._to_u_long_long = partial(_to_int, limit=_U_LONG_LONG_MAX)
+        else:
+            self._to_double = _digits_first(locale.toDouble, math.inf)
+            self._to_u_short = _digits_first(locale.toUShort, _U_SHORT_MAX)
+            self._to_u_long_long = _digits_first(locale.toULongLong, _U_LONG_LONG_MAX)
+
     def fixup(self, text: str) -> None:
-        text = ":".join(part or "00" for part in text.split(":"))
-        self.lineEdit().setText(text or "00:00")
-        if not self.time_delta:
-            self.time_delta = self._last_correct_delta
+        # fill the empty fields with zeros
+        if text.startswith(":"):
+            text = "00" + text
+        if text.endswith(":"):
+            text += "00"
+        while "::" in text:
+            text = text.replace("::", ":00:")
+        self._line_edit.setText(text or "00:00")
+        try:
+            if self.time_delta:
+                return
+        except ValueError:
+            pass
+        self.time_delta = self._last_correct_delta
 
-    def sizeHint(self) -> QtCore.QSize:
+    def _update_size_hints(self) -> None:
+        # both hints are made at once to share the style option
         # from the source of QAbstractSpinBox
-        h: int = self.lineEdit().sizeHint().height()
-        w: int = self.fontMetrics().horizontalAdvance(TimeSpanEdit._MAX_TEXT + " ")
+        w: int = self.fontMetrics().horizontalAdvance(TimeSpanEdit._MAX_TEXT_WITH_SPACE)
         w += 2  # cursor blinking space
         opt: QtWidgets.QStyleOptionSpinBox = QtWidgets.QStyleOptionSpinBox()
         self.initStyleOption(opt)
-        hint: QtCore.QSize = QtCore.QSize(w, h)
-        return self.style().sizeFromContents(QtWidgets.QStyle.ContentsType.CT_SpinBox, opt, hint, self)
+        style: QtWidgets.QStyle = self.style()
+        self._size_hint = style.sizeFromContents(
+            QtWidgets.QStyle.ContentsType.CT_SpinBox,
+            opt,
+            QtCore.QSize(w, self._line_edit.sizeHint().height()),
+            self,
+        )
+        self._minimum_size_hint = style.sizeFromContents(
+            QtWidgets.QStyle.ContentsType.CT_SpinBox,
+            opt,
+            QtCore.QSize(w, self._line_edit.minimumSizeHint().height()),
+            self,
+        )
+
+    def sizeHint(self) -> QtCore.QSize:
+        if self._size_hint is None:
+            self._update_size_hints()
+        return cast(QtCore.QSize, self._size_hint)
 
     def minimumSizeHint(self) -> QtCore.QSize:
-        # from the source of QAbstractSpinBox
-        h: int = self.lineEdit().minimumSizeHint().height()
-        w: int = self.fontMetrics().horizontalAdvance(TimeSpanEdit._MAX_TEXT + " ")
-        w += 2  # cursor blinking space
-        opt: QtWidgets.QStyleOptionSpinBox = QtWidgets.QStyleOptionSpinBox()
-        self.initStyleOption(opt)
-        hint: QtCore.QSize = QtCore.QSize(w, h)
-        return self.style().sizeFromContents(QtWidgets.QStyle.ContentsType.CT_SpinBox, opt, hint, self)
+        if self._minimum_size_hint is None:
+            self._update_size_hints()
+        return cast(QtCore.QSize, self._minimum_size_hint)
 
     def stepBy(self, steps: int) -> None:
-        cursor_position: int = self.lineEdit().cursorPosition()
-        place: int = self.text().count(":", cursor_position)
+        cursor_position: int = self._line_edit.cursorPosition()
+        place: int = self._line_edit.text().count(":", cursor_position)
         time_to_add: timedelta = timedelta(
             **{
                 (
@@ -76,125 +218,106 @@ class TimeSpanEdit(QtWidgets.QAbstractSpinBox):
                 )[place]: steps
             }
         )
-        self.time_delta += time_to_add
-        while cursor_position > 0 and self.text().count(":", cursor_position) < place:
-            cursor_position -= 1
-        while cursor_position < len(self.text()) and self.text().count(":", cursor_position) > place:
-            cursor_position += 1
-        self.lineEdit().setCursorPosition(cursor_position)
-        self.timeSpanChanged.emit(self.time_delta)
+        delta: timedelta = self.time_delta + time_to_add
+        self.time_delta = delta  # the setter keeps the cursor in the same field
+        self._step_timer.start()
 
     def stepEnabled(self) -> QtWidgets.QAbstractSpinBox.StepEnabledFlag:
-        if not self.hasAcceptableInput():
-            return cast(
-                QtWidgets.QAbstractSpinBox.StepEnabledFlag,
-                QtWidgets.QAbstractSpinBox.StepEnabledFlag.StepNone,
-            )
-        if self.time_delta.total_seconds() > 0.0:
-            return cast(
-                QtWidgets.QAbstractSpinBox.StepEnabledFlag,
-                QtWidgets.QAbstractSpinBox.StepEnabledFlag.StepDownEnabled
-                | QtWidgets.QAbstractSpinBox.StepEnabledFlag.StepUpEnabled,
-            )
-        return cast(
-            QtWidgets.QAbstractSpinBox.StepEnabledFlag,
-            QtWidgets.QAbstractSpinBox.StepEnabledFlag.StepUpEnabled,
-        )
+        # parsing the text tells whether it's acceptable as well as `validate` does, and the result is memoized
+        try:
+            if self.time_delta:
+                return TimeSpanEdit._STEP_UP_AND_DOWN
+        except ValueError:
+            return TimeSpanEdit._STEP_NONE
+        return TimeSpanEdit._STEP_UP
 
     def validate(self, text: str, cursor_position: int) -> tuple[QtGui.QValidator.State, str, int]:
-        # remove invalid characters
-        valid_characters: str = "0123456789:" + self.locale().decimalPoint()
-        i: int = 0
-        while i < len(text):
-            while i < len(text) and text[i] not in valid_characters:
-                text = text[:i] + text[i + 1 :]
-                if i <= cursor_position:
-                    cursor_position -= 1
-            else:
-                i += 1
+        # remove invalid characters; usually, there are none, and a single search tells that
+        if self._invalid_characters.search(text) is not None:
+            cursor_position -= len(self._invalid_characters.findall(text, 0, cursor_position))
+            text = self._invalid_characters.sub("", text)
 
         if not text:
             return QtGui.QValidator.State.Intermediate, text, cursor_position
 
-        parts: list[str] = text.split(":")
+        state: QtGui.QValidator.State
+        state, _ = self._parse_parts(text.split(":"))
+        return state, text, cursor_position
+
+    def _parse_parts(self, parts: list[str]) -> tuple[QtGui.QValidator.State, timedelta | None]:
+        # the same parsing for `validate` and `time_delta`; the time span is `None` unless the state is acceptable
         if len(parts) <= 4 and not all(parts):
             # text starts or ends with ':' or contains '::', the rest has not been entered yet
-            return QtGui.QValidator.State.Intermediate, text, cursor_position
+            return QtGui.QValidator.State.Intermediate, None
+
+        to_double: Callable[[str], tuple[float, bool]] = self._to_double
+        to_u_short: Callable[[str], tuple[int, bool]] = self._to_u_short
+        to_u_long_long: Callable[[str], tuple[int, bool]] = self._to_u_long_long
+
         ok: bool
         seconds: float
-        seconds, ok = self.locale().toDouble(parts[-1])
+        minutes: int = 0
+        hours: int = 0
+        days: int = 0
+        seconds, ok = to_double(parts[-1])
         if not ok:
-            return QtGui.QValidator.State.Invalid, text, cursor_position
+            return QtGui.QValidator.State.Invalid, None
         elif seconds > 60.0:
-            return QtGui.QValidator.State.Intermediate, text, cursor_position
+            return QtGui.QValidator.State.Intermediate, None
 
         if len(parts) >= 2:
-            minutes: int
-            minutes, ok = self.locale().toUShort(parts[-2])
+            minutes, ok = to_u_short(parts[-2])
             if not ok:
-                return QtGui.QValidator.State.Invalid, text, cursor_position
+                return QtGui.QValidator.State.Invalid, None
             elif minutes > 60:
-                return QtGui.QValidator.State.Intermediate, text, cursor_position
+                return QtGui.QValidator.State.Intermediate, None
 
         if len(parts) >= 3:
-            hours: int
-            hours, ok = self.locale().toUShort(parts[-3])
+            hours, ok = to_u_short(parts[-3])
             if not ok:
-                return QtGui.QValidator.State.Invalid, text, cursor_position
+                return QtGui.QValidator.State.Invalid, None
             if hours > 24:
-                return QtGui.QValidator.State.Intermediate, text, cursor_position
+                return QtGui.QValidator.State.Intermediate, None
 
         if len(parts) >= 4:
-            days: int
-            days, ok = self.locale().toULongLong(parts[-4])
+            days, ok = to_u_long_long(parts[-4])
             if not ok:
-                return QtGui.QValidator.State.Invalid, text, cursor_position
+                return QtGui.QValidator.State.Invalid, None
+            if days > timedelta.max.days:
+                return QtGui.QValidator.State.Intermediate, None
 
         if len(parts) >= 5:
-            return QtGui.QValidator.State.Invalid, text, cursor_position
+            return QtGui.QValidator.State.Invalid, None
 
-        return QtGui.QValidator.State.Acceptable, text, cursor_position
+        delta: timedelta
+        try:
+            delta = timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+        except OverflowError:  # the hours, the minutes, or the seconds add up to more than `timedelta.max`
+            return QtGui.QValidator.State.Intermediate, None
+        return QtGui.QValidator.State.Acceptable, delta
 
     @property
     def time_delta(self) -> timedelta:
-        if not self.text():
-            raise ValueError
-        parts: list[str] = self.text().split(":")
-        ok: bool
-        seconds: float
-        minutes: int = 0
-        hours: int = 0
-        days: int = 0
-        seconds, ok = self.locale().toDouble(parts[-1])
-        if not ok or seconds > 60.0:
-            raise ValueError
-        if len(parts) >= 2:
-            minutes, ok = self.locale().toUShort(parts[-2])
-            if not ok or minutes > 60:
-                raise ValueError
-        if len(parts) >= 3:
-            hours, ok = self.locale().toUShort(parts[-3])
-            if not ok or hours > 24:
+        text: str = self._line_edit.text()
+        if text != self._parsed_text:
+            delta: timedelta | None = self._parse_parts(text.split(":"))[1]
+            if delta is None:
                 raise ValueError
-        if len(parts) >= 4:
-            days, ok = self.locale().toULongLong(parts[-4])
-            if not ok:
-                raise ValueError
-        if len(parts) >= 5:
-            raise ValueError
-        return timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+            self._parsed_delta = delta
+            self._parsed_text = text
+        return self._parsed_delta
 
     @time_delta.setter
     def time_delta(self, delta: timedelta) -> None:
         self.blockSignals(True)
-        cursor_position: int = self.lineEdit().cursorPosition()
-        place: int = self.text().count(":", cursor_position)
-        self.lineEdit().setText(_timedelta_to_text(delta))
-        while cursor_position > 0 and self.text().count(":", cursor_position) < place:
-            cursor_position -= 1
-        while cursor_position < len(self.text()) and self.text().count(":", cursor_position) > place:
-            cursor_position += 1
-        self.lineEdit().setCursorPosition(cursor_position)
+        cursor_position: int = self._line_edit.cursorPosition()
+        place: int = self._line_edit.text().count(":", cursor_position)
+        text: str = _timedelta_to_text(delta)
+        self._line_edit.setText(text)
+        # no need to parse the text just made
+        self._parsed_text = text
+        self._parsed_delta = delta
+        self._line_edit.setCursorPosition(_cursor_position_at_place(text, cursor_position, place))
         self._last_correct_delta = delta
         self.blockSignals(False)
 
@@ -203,14 +326,25 @@ class TimeSpanEdit(QtWidgets.QAbstractSpinBox):
         return self.time_delta.total_seconds()
 
     def from_two_q_date_time(self, date_time_1: QtCore.QDateTime, date_time_2: QtCore.QDateTime) -> None:
-        self.time_delta = abs(date_time_2.toPython() - date_time_1.toPython())
+        # `QDateTime` holds milliseconds, so nothing is lost
+        self.time_delta = timedelta(milliseconds=abs(date_time_1.msecsTo(date_time_2)))
 
     @QtCore.Slot()
     def _on_edit_finished(self) -> None:
         # why do we call the fix-up manually??
-        if not self.hasAcceptableInput():
-            self.fixup(self.text())
-        delta_changed: bool = self.time_delta != self._last_correct_delta
-        self.time_delta = self.time_delta  # not an error, we need the time to be normalized
+        # parsing the text tells whether it's acceptable as well as `validate` does, so there's no need to run both
+        delta: timedelta
+        try:
+            delta = self.time_delta
+        except ValueError:
+            self.fixup(self._line_edit.text())
+            delta = self.time_delta
+        delta_changed: bool = delta != self._last_correct_delta
+        self.time_delta = delta  # not an error, we need the time to be normalized
         if delta_changed:
-            self.timeSpanChanged.emit(self.time_delta)
+            self._step_timer.stop()
+            self.timeSpanChanged.emit(delta)
+
+    @QtCore.Slot()
+    def _on_step_timer_timeout(self) -> None:
+        self.timeSpanChanged.emit(self._last_correct_delta)
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import os
 from datetime import datetime
-from pathlib import Path
-from typing import ClassVar, Final, Iterable, Sequence, cast, final
+from typing import ClassVar, Final, Iterable, cast, final
 
 import numpy as np
 from numpy.typing import NDArray
@@ -11,18 +11,27 @@ from pyqtgraph import ComboBox, ViewBox
 from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 
 from ._data_model import DataModel
-from ._file_dialog import FileDialog
+from ._file_dialog import FileDialog, FileWriterSignals
+from ._file_parser import FileParser, FileParserSignals, ParsedFile
 from ._menu_bar import MenuBar
-from ._plot import Plot
+from ._plot import Plot, is_sorted, visible_slice
 from ._plot_line_options import PlotLineOptions
 from ._preferences import Preferences
 from ._settings import Settings
-from ..log_parser import parse
 
 __all__ = ["MainWindow", "PLOT_LINES_COUNT"]
 
 PLOT_LINES_COUNT: Final[int] = 8
 
+# language=SVG
+_WINDOW_ICON_SVG: Final[bytes] = b"""
+<svg version="1.1" viewBox="0 0 128 128" xmlns="http://www.w3.org/2000/svg">
+    <rect width="128" height="128" fill="#282e70"/>
+    <path d="M 23 44 A 44 44 0 1 1 23 84" fill="none" stroke="#fff" stroke-linecap="round" stroke-width="18"/>
+    <path d="M 45 32 A 36.5 36.5 0 1 1 45 96 A 40 40 0 1 0 45 32" fill="#282e70" stroke="none"/>
+</svg>
+"""
+
 
 @final
 class MainWindow(QtWidgets.QMainWindow):
@@ -30,6 +39,7 @@ class MainWindow(QtWidgets.QMainWindow):
         "initial main window title",
         "VeriCold Plotter",
     )
+    _window_icon: ClassVar[QtGui.QIcon | None] = None
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent=parent)
@@ -58,25 +68,29 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.status_bar: QtWidgets.QStatusBar = QtWidgets.QStatusBar(self)
 
+        self.file_parser_signals: FileParserSignals = FileParserSignals(self)
+        # the number of the latest request to parse files, for the results of the earlier ones to be dropped
+        self.parse_request: int = 0
+        self.parsing: bool = False
+        self.reloading: bool = False
+        self.check_file_updates_on_load: bool = False
+        # the file parsed last, kept here in the UI thread, for reloading it to take only what has been changed
+        self.last_parsed: ParsedFile | None = None
+
+        self.file_writer_signals: FileWriterSignals = FileWriterSignals(self)
+        self.exporting: bool = False
+
+        self.lines_to_replot: set[int] = set()
+        self.replot_timer: QtCore.QTimer = QtCore.QTimer(self)
+
+        self.file_watcher: QtCore.QFileSystemWatcher = QtCore.QFileSystemWatcher(self)
         self.reload_timer: QtCore.QTimer = QtCore.QTimer(self)
         self.file_created: float = 0.0
 
         self.setup_ui()
 
     def setup_ui(self) -> None:
-        # https://ru.stackoverflow.com/a/1032610
-        window_icon: QtGui.QPixmap = QtGui.QPixmap()
-        # language=SVG
-        window_icon.loadFromData(
-            b"""
-<svg version="1.1" viewBox="0 0 128 128" xmlns="http://www.w3.org/2000/svg">
-    <rect width="128" height="128" fill="#282e70"/>
-    <path d="M 23 44 A 44 44 0 1 1 23 84" fill="none" stroke="#fff" stroke-linecap="round" stroke-width="18"/>
-    <path d="M 45 32 A 36.5 36.5 0 1 1 45 96 A 40 40 0 1 0 45 32" fill="#282e70" stroke="none"/>
-</svg>
-"""
-        )
-        self.setWindowIcon(QtGui.QIcon(window_icon))
+        self.setWindowIcon(MainWindow._get_window_icon())
 
         self.setObjectName("main_window")
         self.resize(640, 480)
@@ -126,11 +140,38 @@ class MainWindow(QtWidgets.QMainWindow):
             cb.colorChanged.connect(self.on_color_changed)
             cb.toggled.connect(self.on_line_toggled)
 
-        self.reload_timer.setInterval(1000)
+        # scrolling through the combo boxes or picking a color changes the lines many times in a row
+        self.replot_timer.setSingleShot(True)
+        self.replot_timer.setInterval(30)
+        self.replot_timer.timeout.connect(self.on_replot_timer_timeout)
+
+        self.file_parser_signals.parsed.connect(self.on_file_parsed)
+        self.file_parser_signals.failed.connect(self.on_file_parse_failed)
+        self.file_parser_signals.finished.connect(self.on_file_parse_finished)
+
+        self.file_writer_signals.started.connect(self.on_file_write_started)
+        self.file_writer_signals.written.connect(self.on_file_written)
+        self.file_writer_signals.failed.connect(self.on_file_write_failed)
+
+        self.file_watcher.fileChanged.connect(self.on_file_changed)
+        # the system might not report the changes, e.g., of the files on network shares, so check them once in a while
+        self.reload_timer.setInterval(5000)
         self.reload_timer.timeout.connect(self.on_timeout)
 
+    @classmethod
+    def _get_window_icon(cls) -> QtGui.QIcon:
+        # the SVG is parsed once, when the first window is made, for there must be an application by then
+        if cls._window_icon is None:
+            # https://ru.stackoverflow.com/a/1032610
+            window_icon: QtGui.QPixmap = QtGui.QPixmap()
+            window_icon.loadFromData(_WINDOW_ICON_SVG)
+            cls._window_icon = QtGui.QIcon(window_icon)
+        return cls._window_icon
+
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         self.reload_timer.stop()
+        # the parser might be reporting to the window, and the exported file should be complete
+        QtCore.QThreadPool.globalInstance().waitForDone()
         self.save_settings()
         event.accept()
 
@@ -152,6 +193,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.settings.beginGroup("plot")
         self.plot.mouse_mode = cast(int, self.settings.value("mouseMode", ViewBox.PanMode, int))
         self.settings.endGroup()
+        self.apply_plot_settings()
+
+    def apply_plot_settings(self) -> None:
+        self.plot.downsampling = self.settings.downsampling
+        self.plot.use_open_gl = self.settings.use_open_gl
+        if self.plot.use_open_gl != self.settings.use_open_gl:
+            # OpenGL is unavailable, so don't try it on every start, and untick it in the preferences
+            self.settings.use_open_gl = self.plot.use_open_gl
 
     def save_settings(self) -> None:
         self.settings.beginGroup("window")
@@ -171,83 +220,89 @@ class MainWindow(QtWidgets.QMainWindow):
             translator.load(str(self.settings.translation_path))
             QtWidgets.QApplication.instance().installTranslator(translator)
 
-    def load_file(self, file_name: str | Iterable[str], check_file_updates: bool = False) -> bool:
+    def load_file(self, file_name: str | Iterable[str], check_file_updates: bool = False) -> None:
+        # the files are parsed in a pool thread, and `show_file` is called when they are
         if not file_name:
-            return False
-        titles: list[str]
-        data: NDArray[np.float64]
-        if isinstance(file_name, (set, Sequence, Iterable)) and not isinstance(file_name, str):
-            all_titles: list[list[str]] = []
-            all_data: list[NDArray[np.float64]] = []
-            _file_names: Iterable[str] = file_name
-            for file_name in _file_names:
-                try:
-                    titles, data = parse(file_name)
-                except (IOError, RuntimeError) as ex:
-                    self.status_bar.showMessage(" ".join(repr(a) for a in ex.args))
-                    continue
-                else:
-                    all_titles.append(titles)
-                    all_data.append(data)
-            if not all_titles or not all_data:
-                return False
-            # use only the files with identical columns
-            titles = all_titles[-1]
-            i: int = len(all_titles) - 2
-            while i >= 0 and all_titles[i] == titles:
-                i -= 1
-            data = np.column_stack(all_data[i + 1 :])
+            return
+        file_names: list[str] = [file_name] if isinstance(file_name, str) else list(file_name)
+        if not file_names:
+            return
+        self.check_file_updates_on_load = check_file_updates
+        self.parse_files(file_names, reloading=False)
+
+    def parse_files(self, file_names: list[str], reloading: bool) -> None:
+        self.parse_request += 1
+        self.parsing = True
+        self.reloading = reloading
+        QtCore.QThreadPool.globalInstance().start(
+            FileParser(self.parse_request, file_names, self.last_parsed, self.file_parser_signals)
+        )
+
+    @QtCore.Slot(int, str, list, object, object)
+    def on_file_parsed(
+        self,
+        request: int,
+        file_name: str,
+        titles: list[str],
+        data: NDArray[np.float64],
+        parsed_file: ParsedFile | None,
+    ) -> None:
+        if request != self.parse_request:
+            return  # other files have been requested since
+        self.last_parsed = parsed_file
+        if self.reloading:
+            self.update_file(titles, data)
         else:
-            try:
-                titles, data = parse(file_name)
-            except (IOError, RuntimeError) as ex:
-                self.status_bar.showMessage(" ".join(repr(a) for a in ex.args))
-                return False
+            self.show_file(file_name, titles, data)
+
+    @QtCore.Slot(int, str)
+    def on_file_parse_failed(self, request: int, message: str) -> None:
+        if request == self.parse_request:
+            self.status_bar.showMessage(message)
+
+    @QtCore.Slot(int)
+    def on_file_parse_finished(self, request: int) -> None:
+        if request == self.parse_request:
+            self.parsing = False
+
+    def show_file(self, file_name: str, titles: list[str], data: NDArray[np.float64]) -> None:
         self.settings.opened_file_name = file_name
         self.data_model.set_data(data, titles)
 
+        # sort the columns out once for all the combo boxes
+        x_titles: list[str] = []
+        y_titles: list[str] = []
+        title: str
+        for title in self.data_model.header:
+            (x_titles if title.endswith(("(secs)", "(s)")) else y_titles).append(title)
+
         self.combo_x_axis.blockSignals(True)
-        self.combo_x_axis.setItems(
-            tuple(
-                filter(
-                    lambda t: t.endswith("(secs)") or t.endswith("(s)"),
-                    self.data_model.header,
-                )
-            )
-        )
+        self.combo_x_axis.setItems(tuple(x_titles))
         self.combo_x_axis.setCurrentText(self.settings.argument)
         self.combo_x_axis.blockSignals(False)
 
+        y_items: tuple[str, ...] = tuple(y_titles)
         cb: PlotLineOptions
         for cb in self.line_options_y_axis:
-            cb.set_items(
-                tuple(
-                    filter(
-                        lambda t: not (t.endswith("(secs)") or t.endswith("(s)")),
-                        self.data_model.header,
-                    )
-                )
-            )
-        self.plot.plot(
-            self.data_model,
-            self.combo_x_axis.value(),
-            (cb.option for cb in self.line_options_y_axis),
-            colors=(cb.color for cb in self.line_options_y_axis),
-            visibility=(cb.checked for cb in self.line_options_y_axis),
-        )
-        self.menu_bar.action_export.setEnabled(True)
-        self.menu_bar.action_export_visible.setEnabled(True)
+            cb.set_items(y_items)
+        # walk the line options once
+        options: tuple[str, ...]
+        colors: tuple[QtGui.QColor, ...]
+        visibility: tuple[bool, ...]
+        options, colors, visibility = zip(*((cb.option, cb.color, cb.checked) for cb in self.line_options_y_axis))
+        self.plot.plot(self.data_model, self.combo_x_axis.value(), options, colors=colors, visibility=visibility)
+        self.menu_bar.action_export.setEnabled(not self.exporting)
+        self.menu_bar.action_export_visible.setEnabled(not self.exporting)
         self.menu_bar.action_reload.setEnabled(True)
         self.menu_bar.action_auto_reload.setEnabled(True)
         self.status_bar.showMessage(self.tr("Ready"))
-        self.file_created = Path(self.settings.opened_file_name).lstat().st_mtime
-        self.check_file_updates = check_file_updates
+        self.file_created = os.stat(self.settings.opened_file_name).st_mtime
+        self.check_file_updates = self.check_file_updates_on_load
         self.setWindowTitle(f"{file_name} — {MainWindow._initial_window_title}")
-        return True
 
     def visible_data(self) -> tuple[NDArray[np.float64], list[str]]:
         header = [self.data_model.header[0]] + [o.option for o in self.line_options_y_axis]
-        data = self.data_model.data[[self.data_model.header.index(h) for h in header]]
+        columns: list[int] = [self.data_model.column_index(h) for h in header]
 
         # crop the visible rectangle
         x_min: float
@@ -255,7 +310,13 @@ class MainWindow(QtWidgets.QMainWindow):
         y_min: float
         y_max: float
         ((x_min, x_max), (y_min, y_max)) = self.plot.view_range
-        data = data[..., ((data[0] >= x_min) & (data[0] <= x_max))]
+        # find the visible rows on a view of the x-axis column, so that only the visible part gets copied
+        x: NDArray[np.float64] = self.data_model[columns[0]]
+        rows: slice | NDArray[np.bool_] = visible_slice(x, x_min, x_max, is_sorted(x))
+        if isinstance(rows, slice):
+            data = self.data_model.data[columns, rows]
+        else:
+            data = self.data_model.data[np.ix_(columns, rows)]
         somehow_visible_lines: list[bool] = [True] + [bool(np.any((d >= y_min) & (d <= y_max))) for d in data[1:]]
         data = data[somehow_visible_lines]
         header = [h for h, b in zip(header, somehow_visible_lines) if b]
@@ -267,7 +328,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @check_file_updates.setter
     def check_file_updates(self, new_value: bool) -> None:
-        self.menu_bar.action_auto_reload.setChecked(new_value)
+        if self.menu_bar.action_auto_reload.isChecked() == new_value:
+            self.on_action_auto_reload_toggled(new_value)  # watch the file opened last
+        else:
+            self.menu_bar.action_auto_reload.setChecked(new_value)
 
     @QtCore.Slot()
     def on_action_open_triggered(self) -> None:
@@ -283,13 +347,31 @@ class MainWindow(QtWidgets.QMainWindow):
             header = self.data_model.header
         else:
             data, header = self.visible_data()
-        try:
-            fd: FileDialog = FileDialog(self.settings, self)
-            fd.export(data, header)
-        except IOError as ex:
-            self.status_bar.showMessage(" ".join(ex.args))
-        else:
-            self.status_bar.showMessage(self.tr("Saved to {0}").format(self.settings.exported_file_name))
+        fd: FileDialog = FileDialog(self.settings, self)
+        fd.export(data, header, self.file_writer_signals)
+
+    @QtCore.Slot(str)
+    def on_file_write_started(self, file_name: str) -> None:
+        # one file at a time
+        self.exporting = True
+        self.menu_bar.action_export.setEnabled(False)
+        self.menu_bar.action_export_visible.setEnabled(False)
+        self.status_bar.showMessage(self.tr("Saving to {0}").format(file_name))
+
+    @QtCore.Slot(str)
+    def on_file_written(self, file_name: str) -> None:
+        self.on_file_write_over()
+        self.status_bar.showMessage(self.tr("Saved to {0}").format(file_name))
+
+    @QtCore.Slot(str, str)
+    def on_file_write_failed(self, _file_name: str, message: str) -> None:
+        self.on_file_write_over()
+        self.status_bar.showMessage(message)
+
+    def on_file_write_over(self) -> None:
+        self.exporting = False
+        self.menu_bar.action_export.setEnabled(True)
+        self.menu_bar.action_export_visible.setEnabled(True)
 
     @QtCore.Slot()
     def on_action_export_triggered(self) -> None:
@@ -305,7 +387,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @QtCore.Slot(bool)
     def on_action_auto_reload_toggled(self, new_state: bool) -> None:
+        watched_files: list[str] = self.file_watcher.files()
+        if watched_files:
+            self.file_watcher.removePaths(watched_files)
         if new_state:
+            self.file_watcher.addPath(self.settings.opened_file_name)
             self.reload_timer.start()
         else:
             self.reload_timer.stop()
@@ -315,36 +401,43 @@ class MainWindow(QtWidgets.QMainWindow):
         preferences_dialog: Preferences = Preferences(self.settings, self)
         preferences_dialog.exec()
         self.install_translation()
+        self.apply_plot_settings()
 
     @QtCore.Slot()
     def on_action_quit_triggered(self) -> None:
         self.close()
 
-    @QtCore.Slot(str)
-    def on_x_axis_changed(self, new_text: str) -> None:
+    def replot_later(self, line_indices: Iterable[int]) -> None:
+        self.lines_to_replot.update(line_indices)
+        if not self.replot_timer.isActive():
+            self.replot_timer.start()
+
+    @QtCore.Slot()
+    def on_replot_timer_timeout(self) -> None:
         normalized: bool = self.combo_y_axis.currentIndex() == 1
+        x_column_name: str = self.combo_x_axis.currentText()
         sender_index: int
-        for sender_index in range(min(len(self.line_options_y_axis), len(self.plot.lines))):
+        for sender_index in sorted(self.lines_to_replot):
+            line_options: PlotLineOptions = self.line_options_y_axis[sender_index]
             self.plot.replot(
                 sender_index,
                 self.data_model,
-                new_text,
-                self.line_options_y_axis[sender_index].option,
+                x_column_name,
+                line_options.option,
+                color=line_options.color,
                 normalized=normalized,
             )
+        self.lines_to_replot.clear()
+
+    @QtCore.Slot(str)
+    def on_x_axis_changed(self, new_text: str) -> None:
+        self.replot_later(range(min(len(self.line_options_y_axis), len(self.plot.lines))))
         self.settings.argument = new_text
 
     @QtCore.Slot(int, str)
-    def on_y_axis_changed(self, sender_index: int, title: str) -> None:
-        normalized: bool = self.combo_y_axis.currentIndex() == 1
-        self.plot.replot(
-            sender_index,
-            self.data_model,
-            self.combo_x_axis.currentText(),
-            title,
-            color=self.settings.line_colors.get(title, PlotLineOptions.DEFAULT_COLOR),
-            normalized=normalized,
-        )
+    def on_y_axis_changed(self, sender_index: int, _: str) -> None:
+        # the line options have taken the color of the new line already
+        self.replot_later((sender_index,))
 
     @QtCore.Slot(int)
     def on_y_axis_mode_changed(self, new_index: int) -> None:
@@ -358,65 +451,70 @@ class MainWindow(QtWidgets.QMainWindow):
             self.plot.canvas.vb.enableAutoRange()
             self.plot.canvas.recomputeAverages()
 
+        x_column_name: str = self.combo_x_axis.currentText()
         sender_index: int
-        for sender_index in range(len(self.line_options_y_axis)):
+        line_options: PlotLineOptions
+        for sender_index, line_options in enumerate(self.line_options_y_axis):
             self.plot.replot(
                 sender_index,
                 self.data_model,
-                self.combo_x_axis.currentText(),
-                self.line_options_y_axis[sender_index].option,
+                x_column_name,
+                line_options.option,
                 normalized=(new_index == 1),
             )
         self.plot.auto_range_y()
 
     @QtCore.Slot(int, QtGui.QColor)
-    def on_color_changed(self, sender_index: int, new_color: QtGui.QColor) -> None:
-        normalized: bool = self.combo_y_axis.currentIndex() == 1
-        self.plot.replot(
-            sender_index,
-            self.data_model,
-            self.combo_x_axis.currentText(),
-            self.line_options_y_axis[sender_index].option,
-            color=new_color,
-            normalized=normalized,
-        )
+    def on_color_changed(self, sender_index: int, _: QtGui.QColor) -> None:
+        self.replot_later((sender_index,))
 
     @QtCore.Slot(int, bool)
     def on_line_toggled(self, sender_index: int, new_state: bool) -> None:
         self.plot.set_line_visible(sender_index, new_state)
 
+    @QtCore.Slot(str)
+    def on_file_changed(self, _: str) -> None:
+        self.on_timeout()
+
     @QtCore.Slot()
     def on_timeout(self) -> None:
-        if not self.settings.opened_file_name:
+        if self.parsing and not self.reloading:
+            return  # don't reload the file that is being replaced
+        file_name: str = self.settings.opened_file_name
+        if not file_name:
             return
 
-        if not Path(self.settings.opened_file_name).exists():
+        # a single `stat` call tells both whether the file exists and when it has been modified
+        file_modified: float
+        try:
+            file_modified = os.stat(file_name).st_mtime
+        except OSError:
             return
-
-        if self.file_created == Path(self.settings.opened_file_name).lstat().st_mtime:
+        if file_name not in self.file_watcher.files():
+            # the file has been replaced or re-created, and the watcher has lost it
+            self.file_watcher.addPath(file_name)
+        if self.file_created == file_modified:
             return
-        else:
-            self.file_created = Path(self.settings.opened_file_name).lstat().st_mtime
+        self.file_created = file_modified
 
-        titles: list[str]
-        data: NDArray[np.float64]
-        try:
-            titles, data = parse(self.settings.opened_file_name)
-        except (IOError, RuntimeError) as ex:
-            self.status_bar.showMessage(" ".join(repr(a) for a in ex.args))
-        else:
-            self.data_model.set_data(data, titles)
-
-            sender_index: int
-            for sender_index in range(min(len(self.line_options_y_axis), len(self.plot.lines))):
-                self.plot.replot(
-                    sender_index,
-                    self.data_model,
-                    self.combo_x_axis.currentText(),
-                    self.line_options_y_axis[sender_index].option,
-                    roll=True,
-                )
-
-            self.status_bar.showMessage(
-                self.tr("Reloaded {0}").format(datetime.now().isoformat(sep=" ", timespec="seconds"))
+        self.parse_files([file_name], reloading=True)
+
+    def update_file(self, titles: list[str], data: NDArray[np.float64]) -> None:
+        self.data_model.set_data(data, titles)
+
+        x_column_name: str = self.combo_x_axis.currentText()
+        sender_index: int
+        line_options: PlotLineOptions
+        # `zip` stops at the shorter one, the line options or the lines
+        for sender_index, (line_options, _) in enumerate(zip(self.line_options_y_axis, self.plot.lines)):
+            self.plot.replot(
+                sender_index,
+                self.data_model,
+                x_column_name,
+                line_options.option,
+                roll=True,
             )
+
+        self.status_bar.showMessage(
+            self.tr("Reloaded {0}").format(datetime.now().isoformat(sep=" ", timespec="seconds"))
+        )
@@ -13,7 +13,7 @@ try:
     import numpy as np
     from numpy.typing import NDArray
 
-    def parse(filename: str | Path | BinaryIO) -> tuple[list[str], NDArray[np.float64]]:
+    def parse(filename: str | Path | BinaryIO, skip_records: int = 0) -> tuple[list[str], NDArray[np.float64]]:
         def _parse(file_handle: BinaryIO) -> tuple[list[str], NDArray[np.float64]]:
             file_handle.seek(0x1800 + 32)
             titles: list[str] = [
@@ -23,6 +23,12 @@ try:
             file_handle.seek(0x3000)
             # noinspection PyTypeChecker
             dt: np.dtype[np.generic] = np.dtype(np.float64).newbyteorder("<")
+            if skip_records:
+                # the records are of the same size, and the first value of a record is its size in bytes
+                record_size_data: bytes = file_handle.read(dt.itemsize)
+                if len(record_size_data) == dt.itemsize:
+                    record_size: int = int(round(np.frombuffer(record_size_data, dtype=dt)[0]))
+                    file_handle.seek(0x3000 + skip_records * record_size)
             data: NDArray[dt] = np.frombuffer(file_handle.read(), dtype=dt)
             i: int = 0
             data_item_size: int | None = None
@@ -45,7 +51,7 @@ try:
 except ImportError:
     import struct
 
-    def parse(filename: str | Path | BinaryIO) -> tuple[list[str], list[list[float]]]:
+    def parse(filename: str | Path | BinaryIO, skip_records: int = 0) -> tuple[list[str], list[list[float]]]:
         def _parse(file_handle: BinaryIO) -> tuple[list[str], list[list[float]]]:
             file_handle.seek(0x1800 + 32)
             titles: list[str] = list(
@@ -59,6 +65,11 @@ except ImportError:
             )
             titles = list(filter(None, titles))
             file_handle.seek(0x3000)
+            if skip_records:
+                # the records are of the same size, and the first value of a record is its size in bytes
+                record_size_data: bytes = file_handle.read(double_size)
+                if len(record_size_data) == double_size:
+                    file_handle.seek(0x3000 + skip_records * int(struct.unpack_from("<d", record_size_data)[0]))
             data: list[list[float]] = [[] for _ in range(len(titles))]
             while True:
                 data_size_data: bytes = file_handle.read(double_size)